@@ -1,8 +1,8 @@
 import time
-import json
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
+import orjson
 from pybit.unified_trading import HTTP
 from config import Config
 
@@ -26,8 +26,8 @@ class BybitService:
         os.makedirs(log_dir, exist_ok=True)
 
         filepath = f'{log_dir}/{filename}.json'
-        with open(filepath, 'w') as f:
-            json.dump(response, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(response, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         print(f"📝 Response logged to {filepath}")
 
     def get_account_info(self) -> Optional[Dict]:
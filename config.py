@@ -28,6 +28,13 @@ class Config:
     # Application Settings
     AUTO_CLEAR_SHEETS = os.getenv("AUTO_CLEAR_SHEETS", "true").lower() == "true"
     ENABLE_FORMATTING = os.getenv("ENABLE_FORMATTING", "true").lower() == "true"
+    # Fixed UTC offset for real-time logger times (e.g. 25200 for UTC+7); unset = system local time.
+    # An invalid value is reported by validate() instead of failing at import
+    _TZ_OFFSET_RAW = os.getenv("TZ_OFFSET_SECONDS", "").strip()
+    try:
+        TZ_OFFSET_SECONDS = int(_TZ_OFFSET_RAW) if _TZ_OFFSET_RAW else None
+    except ValueError:
+        TZ_OFFSET_SECONDS = None
     
     @classmethod
     def validate(cls):
@@ -46,6 +53,10 @@ class Config:
         if not cls.GOOGLE_SPREADSHEET_ID and not cls.GOOGLE_SPREADSHEET_NAME:
             errors.append("Either GOOGLE_SPREADSHEET_ID or GOOGLE_SPREADSHEET_NAME is required")
         
+        if cls._TZ_OFFSET_RAW and (cls.TZ_OFFSET_SECONDS is None or abs(cls.TZ_OFFSET_SECONDS) > 14 * 3600):
+            errors.append(f"TZ_OFFSET_SECONDS must be whole seconds between -50400 and 50400 "
+                          f"(e.g. 25200 for UTC+7), got '{cls._TZ_OFFSET_RAW}'")
+        
         if errors:
             raise ValueError("Configuration errors:\n" + "\n".join(f"- {error}" for error in errors))
         
@@ -68,4 +79,5 @@ class Config:
         print(f"   Spreadsheet ID: {cls.GOOGLE_SPREADSHEET_ID or 'Using name instead'}")
         print(f"   Spreadsheet Name: {cls.GOOGLE_SPREADSHEET_NAME}")
         print(f"   Auto Clear: {cls.AUTO_CLEAR_SHEETS}")
-        print(f"   Formatting: {cls.ENABLE_FORMATTING}")
\ No newline at end of file
+        print(f"   Formatting: {cls.ENABLE_FORMATTING}")
+        print(f"   Realtime UTC Offset: {cls.TZ_OFFSET_SECONDS if cls.TZ_OFFSET_SECONDS is not None else 'System local time'}")
\ No newline at end of file
@@ -1,5 +1,95 @@
+import re
+import sys
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from itertools import chain
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from dateutil import tz
+
+
+def _to_local_datetime(epoch_ms: pd.Series) -> pd.Series:
+    """Converts epoch milliseconds to naive local datetimes, matching datetime.fromtimestamp"""
+    return pd.to_datetime(epoch_ms, unit='ms', utc=True).dt.tz_convert(tz.tzlocal()).dt.tz_localize(None)
+
+
+_MONTH_ABBR = np.array(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                        'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+
+# Character offsets of each strftime field inside numpy's 'YYYY-MM-DDTHH:MM:SS' strings
+_ISO_FIELDS = {'Y': (0, 4), 'm': (5, 7), 'd': (8, 10),
+               'H': (11, 13), 'M': (14, 16), 'S': (17, 19)}
+
+
+def _format_epoch_ms(epoch_ms, fmt: str) -> List[str]:
+    """
+    Formats epoch milliseconds as local-time strings in one vectorized pass.
+    Supports the strftime fields %Y %m %d %H %M %S and %b (English month abbreviation).
+    """
+    local = _to_local_datetime(pd.Series(epoch_ms, dtype='int64')).to_numpy()
+    chars = np.datetime_as_string(local, unit='s').astype(
+        'U19').view('U1').reshape(-1, 19)
+
+    result = np.full(len(local), '', dtype='U1')
+    for part in re.split(r'(%[a-zA-Z])', fmt):
+        if not part:
+            continue
+        if part == '%b':
+            piece = _MONTH_ABBR[local.astype(
+                'datetime64[M]').astype('int64') % 12]
+        elif part.startswith('%'):
+            start, stop = _ISO_FIELDS[part[1]]
+            piece = np.ascontiguousarray(
+                chars[:, start:stop]).view(f'U{stop - start}').ravel()
+        else:
+            piece = part
+        result = np.char.add(result, piece)
+    return result.tolist()
+
+
+def _parse_epoch_ms(values) -> np.ndarray:
+    """Parses raw API timestamps to float64 epoch milliseconds; unparsable values become NaN"""
+    return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+
+
+def _usable_newest_first(epoch_ms: np.ndarray, label: str) -> np.ndarray:
+    """
+    Returns indices of records with a parsable, non-zero timestamp, newest first (ties keep input order).
+    Rejected records are reported once per batch.
+    """
+    invalid = np.isnan(epoch_ms)
+    zero = epoch_ms == 0
+    if invalid.any():
+        print(
+            f"⚠️  Error processing {int(invalid.sum())} {label}: invalid timestamp. Skipping.")
+    if zero.any():
+        print(
+            f"⚠️  Warning: Found {int(zero.sum())} {label} with a zero timestamp. Skipping.")
+    keep = np.flatnonzero(~(invalid | zero))
+    return keep[(-epoch_ms[keep]).argsort(kind='stable')]
+
+
+# Bound formatters, created once instead of per formatted value
+_FMT8 = '{:.8f}'.format
+_FMT8_SIGNED = '{:+.8f}'.format
+
+
+class ProgressBuffer:
+    """Collects progress lines and writes them to stdout in a single call"""
+
+    def __init__(self):
+        self._lines: List[str] = []
+
+    def log(self, message: str) -> None:
+        self._lines.append(message)
+
+    def flush(self) -> None:
+        if not self._lines:
+            return
+        sys.stdout.write("\n".join(self._lines) + "\n")
+        sys.stdout.flush()
+        self._lines.clear()
 
 
 class DataProcessor:
@@ -7,9 +97,67 @@ class DataProcessor:
     Service for processing HISTORICAL trading data from the Bybit API
     """
 
+    _progress = ProgressBuffer()
+
+    # Column order of the rows returned by each processor
+    FUTURES_HEADERS = ("Symbol", "Side", "Lev", "PnL", "Fee",
+                       "Hours Held", "Open Time", "Close Time")
+    SPOT_HEADERS = ("Symbol", "Side", "Quantity", "Price",
+                    "Total Value", "Fee", "Fee Currency", "Time")
+    WALLET_FLOW_HEADERS = ("Coin", "Direction", "Network", "Amount",
+                           "Chain/Address", "Status", "Time", "TX ID")
+    INTERNAL_TRANSFER_HEADERS = ("Time", "Coin", "Amount",
+                                 "From Account", "To Account", "Status")
+    UNIVERSAL_TRANSFER_HEADERS = ("Time", "Transfer ID", "Coin", "Amount", "From Member ID",
+                                  "To Member ID", "From Account", "To Account", "Status")
+    CONVERT_HISTORY_HEADERS = ("Time", "Exchange TX ID", "From Coin", "To Coin", "From Amount",
+                               "To Amount", "Convert Rate", "Account Type", "Status")
+    ASSET_ALLOCATION_HEADERS = ("Coin", "Balance", "USD Value", "Percentage",
+                                "Wallet", "Unrealised PnL", "Cumulative Realised PnL")
+
+    # Numeric status codes used by internal (off-chain) deposits
+    INTERNAL_DEPOSIT_STATUS = {
+        1: 'Processing',
+        2: 'Success',
+        3: 'Failed'
+    }
+
+    # Numeric status codes used by on-chain deposits
+    ONCHAIN_DEPOSIT_STATUS = {
+        0: 'Unknown',
+        1: 'To Be Confirmed',
+        2: 'Processing',
+        3: 'Success',
+        4: 'Failed',
+        10011: 'Pending Credit to Funding Pool',
+        10012: 'Credited to Funding Pool'
+    }
+
+    @classmethod
+    def flush_progress(cls) -> None:
+        """Writes the buffered per-processor progress lines to stdout"""
+        cls._progress.flush()
+
+    @staticmethod
+    def _extract_total_balance(wallet_balance: Optional[Dict]) -> float:
+        """
+        Returns the USD total of a wallet balance payload: totalEquity for UNIFIED responses,
+        or the summed coin usdValue for FUND responses.
+        """
+        if not wallet_balance:
+            return 0.0
+
+        if 'list' in wallet_balance:
+            return float(wallet_balance['list'][0].get('totalEquity', 0))
+
+        total = 0.0
+        for coin in wallet_balance.get('balance') or []:
+            total += float(coin.get('usdValue', 0))
+        return total
+
     @staticmethod
     def process_portfolio_overview(
-        futures_history: List[Dict],
+        futures_history: List[Sequence],
         wallet_balance_unified: Optional[Dict],
         wallet_balance_fund: Optional[Dict],
         portfolio_start_date: str
@@ -19,6 +167,7 @@ class DataProcessor:
         Filters futures_history to only include trades closed within the portfolio date range.
 
         Args:
+            futures_history: Rows from process_futures_data (in FUTURES_HEADERS order)
             wallet_balance_unified: UNIFIED account wallet balance
             wallet_balance_fund: FUND (Funding) wallet balance (pre-enriched with usdValue)
             portfolio_start_date: Start date for filtering portfolio data
@@ -27,16 +176,12 @@ class DataProcessor:
             return None
 
         # 1. Get Current Balance (Unified) and Total Balance (Unified + Fund)
-        unified_balance = float(
-            wallet_balance_unified['list'][0].get('totalEquity', 0))
+        unified_balance = DataProcessor._extract_total_balance(
+            wallet_balance_unified)
 
         # Calculate Funding wallet balance
-        fund_balance = 0.0
-        if wallet_balance_fund and wallet_balance_fund.get('balance'):
-            fund_coins = wallet_balance_fund['balance']
-            for coin in fund_coins:
-                usd_value = float(coin.get('usdValue', 0))
-                fund_balance += usd_value
+        fund_balance = DataProcessor._extract_total_balance(
+            wallet_balance_fund)
 
         # 2. Total Balance = UNIFIED + FUND
         total_balance = unified_balance + fund_balance
@@ -51,45 +196,32 @@ class DataProcessor:
         end_date = datetime.now()
 
         # Filter futures_history to only include trades closed within portfolio date range
-        filtered_futures = []
-        for trade in futures_history:
-            try:
-                # Parse close time from the trade (format: "Sep-15 08:44")
-                close_time_str = trade.get('Close Time', '')
-                if close_time_str:
-                    # Add current year to the close time for proper parsing
-                    close_time = datetime.strptime(
-                        f"{close_time_str} {end_date.year}", "%b-%d %H:%M %Y")
-
-                    # Handle year boundary (if close time is in future, it's from previous year)
-                    if close_time > end_date:
-                        close_time = close_time.replace(year=end_date.year - 1)
-
-                    # Only include trades closed within portfolio date range
-                    if start_date <= close_time <= end_date:
-                        filtered_futures.append(trade)
-            except (ValueError, KeyError) as e:
-                # If parsing fails, skip this trade
-                print(
-                    f"⚠️  Warning: Could not parse close time for trade: {e}")
-                continue
+        trades = pd.DataFrame(futures_history, columns=list(
+            DataProcessor.FUTURES_HEADERS), dtype=object)
+        # Parse close times (format: "Sep-15 08:44") with the current year added, in one pass
+        close_time_str = trades['Close Time'].fillna('').astype(str)
+        close_time = pd.to_datetime(close_time_str + f" {end_date.year}",
+                                    format="%b-%d %H:%M %Y", errors='coerce')
+        unparsed = int((close_time.isna() & close_time_str.ne('')).sum())
+        if unparsed:
+            print(
+                f"⚠️  Warning: Could not parse close time for {unparsed} trades")
+
+        # Handle year boundary (if close time is in future, it's from previous year)
+        close_time = close_time.mask(
+            close_time > end_date, close_time - pd.DateOffset(years=1))
+
+        # Only include trades closed within portfolio date range
+        in_range = ((close_time >= start_date) &
+                    (close_time <= end_date)).to_numpy()
 
         # 4. Calculate Net PnL and Win Rate from filtered trades
-        net_pnl = 0
-        winning_trades = 0
-        total_trades = len(filtered_futures)
-
-        if total_trades > 0:
-            for trade in filtered_futures:
-                pnl = float(trade.get('PnL', 0))
-                if pnl > 0:
-                    winning_trades += 1
-                net_pnl += pnl
-
-            win_rate = (winning_trades /
-                        total_trades) if total_trades > 0 else 0
-        else:
-            win_rate = 0
+        pnl = pd.to_numeric(trades.loc[in_range, 'PnL'],
+                            errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+        total_trades = len(pnl)
+        winning_trades = int((pnl > 0).sum())
+        net_pnl = sum(pnl.tolist())
+        win_rate = (winning_trades / total_trades) if total_trades > 0 else 0
 
         # Calculate the date range display using portfolio start date
         date_range_str = f"{start_date.strftime('%b %d, %Y')} - {end_date.strftime('%b %d, %Y')}"
@@ -111,341 +243,273 @@ class DataProcessor:
         return overview_data
 
     @staticmethod
-    def process_futures_data(positions: List[Dict], wallet_balance: Optional[Dict] = None) -> List[Dict]:
+    def process_futures_data(positions: List[Dict], wallet_balance: Optional[Dict] = None) -> Tuple[Tuple[str, ...], List[tuple]]:
         """
         Processes closed futures positions to create a clean and ACCURATE 'Futures History' log
         based on reliably available API data.
+        Works column-wise on a DataFrame so parsing and formatting run in pandas instead of per row.
+        Returns (FUTURES_HEADERS, rows) with each row in header order.
         """
+        headers = DataProcessor.FUTURES_HEADERS
         if not positions:
-            return []
+            return headers, []
 
-        print(
+        DataProcessor._progress.log(
             f"   - Processing {len(positions)} futures positions for 'Futures History'...")
 
-        futures_log = []
-        for position in positions:
-            try:
-                # Open/Close Time & Hold Duration from execution matching
-                open_time_ms = int(position.get('actualOpenTime', 0))
-                close_time_ms = int(position.get('actualCloseTime', 0))
-                open_time = datetime.fromtimestamp(open_time_ms / 1000)
-                close_time = datetime.fromtimestamp(close_time_ms / 1000)
-                hold_duration = close_time - open_time
-
-                pnl = float(position.get('closedPnl', 0))
-                total_fee_cost = float(position.get(
-                    'openFee', 0)) + float(position.get('closeFee', 0))
-                leverage = position.get('leverage', '1')
-                total_hours = hold_duration.total_seconds() / 3600
-                hours_held_simplified = f"{total_hours:.1f}"
-
-                # Simplified time format: "Sep-15 08:44"
-                open_time_simplified = open_time.strftime('%b-%d %H:%M')
-                close_time_simplified = close_time.strftime('%b-%d %H:%M')
-
-                futures_log.append({
-                    "Symbol": position.get('symbol', ''),
-                    "Side": "Buy" if position.get('side') == "Sell" else "Sell",
-                    "Lev": leverage,
-                    "PnL": f"{pnl:.4f}",
-                    "Fee": f"{total_fee_cost:.4f}",
-                    "Hours Held": hours_held_simplified,
-                    "Open Time": open_time_simplified,
-                    "Close Time": close_time_simplified,
-                    "_close_time_sort": close_time,
-                })
-            except Exception as e:
-                print(
-                    f"⚠️  Error processing futures position {position.get('symbol', 'Unknown')}: {e}")
-                continue
-
-        sorted_log = sorted(
-            futures_log, key=lambda x: x['_close_time_sort'], reverse=True)
-
-        for entry in sorted_log:
-            entry.pop('_close_time_sort', None)
-
-        return sorted_log
+        df = pd.DataFrame(positions).reindex(
+            columns=['symbol', 'side', 'leverage', 'actualOpenTime', 'actualCloseTime',
+                     'closedPnl', 'openFee', 'closeFee'])
+
+        # Missing numeric fields default to 0, unparsable ones invalidate the row
+        numeric_cols = ['actualOpenTime', 'actualCloseTime',
+                        'closedPnl', 'openFee', 'closeFee']
+        numeric = df[numeric_cols].fillna(0).apply(
+            pd.to_numeric, errors='coerce')
+        valid = numeric.notna().all(axis=1)
+        for symbol in df.loc[~valid, 'symbol'].fillna('Unknown'):
+            print(
+                f"⚠️  Error processing futures position {symbol}: invalid numeric field")
+        df = df[valid]
+        numeric = numeric[valid]
+        if df.empty:
+            return headers, []
+
+        # Numeric core runs on plain float64 arrays (no index alignment or per-element boxing)
+        values = numeric.to_numpy(dtype=np.float64)
+        # Open/Close Time & Hold Duration from execution matching
+        open_time_ms = values[:, 0].astype(np.int64)
+        close_time_ms = values[:, 1].astype(np.int64)
+        pnl = values[:, 2]
+        total_fee_cost = values[:, 3] + values[:, 4]
+        total_hours = (close_time_ms - open_time_ms) / 3_600_000
+
+        futures_log = pd.DataFrame({
+            "Symbol": df['symbol'].fillna(''),
+            "Side": df['side'].map(lambda side: "Buy" if side == "Sell" else "Sell"),
+            "Lev": df['leverage'].fillna('1'),
+            # printf-style formatting runs over the whole column in C
+            "PnL": np.char.mod('%.4f', pnl).tolist(),
+            "Fee": np.char.mod('%.4f', total_fee_cost).tolist(),
+            "Hours Held": np.char.mod('%.1f', total_hours).tolist(),
+            # Simplified time format: "Sep-15 08:44"
+            "Open Time": _format_epoch_ms(open_time_ms, '%b-%d %H:%M'),
+            "Close Time": _format_epoch_ms(close_time_ms, '%b-%d %H:%M'),
+        }, index=df.index)
+
+        # Stable sort keeps the API order for positions closed in the same millisecond
+        order = (-close_time_ms).argsort(kind='stable')
+        return headers, list(futures_log.iloc[order].itertuples(index=False, name=None))
 
     @staticmethod
-    def process_spot_data(trades: List[Dict]) -> List[Dict]:
+    def process_spot_data(trades: List[Dict]) -> Tuple[Tuple[str, ...], List[tuple]]:
         """
         Processes spot executions to create the 'Spot History' (Basic trade log requirement).
+        Returns (SPOT_HEADERS, rows) with each row in header order.
         """
+        headers = DataProcessor.SPOT_HEADERS
         if not trades:
-            return []
-
-        print(f"   - Processing {len(trades)} trades for 'Spot History'...")
-
-        spot_log = []
-        for trade in trades:
-            try:
-                exec_time = datetime.fromtimestamp(int(trade['execTime'])/1000)
-                qty = float(trade.get('execQty', 0))
-                price = float(trade.get('execPrice', 0))
-                value = qty * price
-
-                spot_log.append({
-                    "Symbol": trade.get('symbol', ''),
-                    "Side": trade.get('side', ''),
-                    "Quantity": f"{qty:.6f}".rstrip('0').rstrip('.'),
-                    "Price": f"{price:.4f}",
-                    "Total Value": f"{value:.4f}",
-                    "Fee": trade.get('execFee', ''),
-                    "Fee Currency": trade.get('feeCurrency', ''),
-                    "Time": exec_time.strftime('%b %d, %H:%M'),
-                })
-            except Exception as e:
-                print(
-                    f"⚠️  Error processing spot trade {trade.get('symbol', 'Unknown')}: {e}")
-                continue
-
-        return sorted(spot_log, key=lambda x: x['Time'], reverse=True)
+            return headers, []
+
+        DataProcessor._progress.log(
+            f"   - Processing {len(trades)} trades for 'Spot History'...")
+
+        # Rows are validated and formatted column-wise, then emitted in sorted order
+        records = pd.DataFrame(trades, dtype=object).reindex(
+            columns=['symbol', 'side', 'execQty', 'execPrice', 'execFee', 'feeCurrency', 'execTime'])
+        exec_time_ms = _parse_epoch_ms(records['execTime'])
+        qty = pd.to_numeric(records['execQty'].fillna(0),
+                            errors='coerce').to_numpy(dtype=np.float64)
+        price = pd.to_numeric(records['execPrice'].fillna(0),
+                              errors='coerce').to_numpy(dtype=np.float64)
+
+        invalid = np.isnan(exec_time_ms) | np.isnan(qty) | np.isnan(price)
+        if invalid.any():
+            print(
+                f"⚠️  Error processing {int(invalid.sum())} spot trades: invalid numeric field. Skipping.")
+        keep = np.flatnonzero(~invalid)
+        if not len(keep):
+            return headers, []
+        order = keep[(-exec_time_ms[keep]).argsort(kind='stable')]
+
+        qty, price = qty[order], price[order]
+        rows = records.iloc[order]
+        spot_log = pd.DataFrame({
+            "Symbol": rows['symbol'].fillna(''),
+            "Side": rows['side'].fillna(''),
+            "Quantity": np.char.rstrip(np.char.rstrip(
+                np.char.mod('%.6f', qty), '0'), '.').tolist(),
+            "Price": np.char.mod('%.4f', price).tolist(),
+            "Total Value": np.char.mod('%.4f', qty * price).tolist(),
+            "Fee": rows['execFee'].fillna(''),
+            "Fee Currency": rows['feeCurrency'].fillna(''),
+            "Time": _format_epoch_ms(exec_time_ms[order].astype(np.int64), '%b %d, %H:%M'),
+        }, index=rows.index)
+        return headers, list(spot_log.itertuples(index=False, name=None))
 
     @staticmethod
-    def process_wallet_flows(deposit_withdraw_data: Dict[str, List[Dict]], internal_deposits: List[Dict] = None) -> List[Dict]:
+    def process_wallet_flows(deposit_withdraw_data: Dict[str, List[Dict]], internal_deposits: List[Dict] = None) -> Tuple[Tuple[str, ...], List[tuple]]:
         """
         Processes deposits/withdrawals for the 'Wallet Flows' log (Inflow/Outflow requirement).
         Combines on-chain deposits/withdrawals with internal (off-chain) deposits.
+        Classification, timestamps and ordering are computed column-wise on a single DataFrame.
+        Returns (WALLET_FLOW_HEADERS, rows) with each row in header order.
         """
-        all_flows = deposit_withdraw_data.get(
-            'deposits', []) + deposit_withdraw_data.get('withdrawals', [])
-
-        # Add internal deposits if provided
-        if internal_deposits:
-            all_flows.extend(internal_deposits)
+        headers = DataProcessor.WALLET_FLOW_HEADERS
+        deposits = deposit_withdraw_data.get('deposits', [])
+        withdrawal_records = deposit_withdraw_data.get('withdrawals', [])
+        internal_deposits = internal_deposits or []
+
+        total_flows = len(deposits) + \
+            len(withdrawal_records) + len(internal_deposits)
+        if not total_flows:
+            return headers, []
+
+        DataProcessor._progress.log(
+            f"   - Processing {total_flows} transactions for 'Wallet Flows'...")
+
+        # object dtype keeps the raw API values (e.g. int vs str status codes) untouched
+        records = pd.DataFrame(
+            list(chain(deposits, withdrawal_records, internal_deposits)), dtype=object
+        ).reindex(columns=['type', 'successAt', 'updateTime', 'createdTime', 'coin',
+                           'amount', 'address', 'chain', 'status', 'txID'])
+
+        # Classify by the list each record came from, not by its fields:
+        # 0 = internal deposit, 1 = on-chain deposit, 2 = withdrawal
+        group = np.repeat([1, 2, 0], [len(deposits), len(
+            withdrawal_records), len(internal_deposits)])
+        is_internal = group == 0
+
+        # Internal deposits use 'createdTime' (in seconds, not milliseconds)
+        internal_ms = pd.to_numeric(
+            records['createdTime'].fillna(0), errors='coerce') * 1000
+        # On-chain: use 'successAt' for deposits or 'updateTime' for withdrawals
+        success_at = records['successAt'].mask(
+            records['successAt'].isin(['', 0]))
+        onchain_ms = pd.to_numeric(success_at.fillna(
+            records['updateTime']).fillna(0), errors='coerce')
+        timestamp_ms = np.where(is_internal, internal_ms, onchain_ms)
+
+        order = _usable_newest_first(timestamp_ms, "wallet flows")
+        if not len(order):
+            return headers, []
+        kept_ms = timestamp_ms[order].astype(np.int64)
+
+        status_maps = (DataProcessor.INTERNAL_DEPOSIT_STATUS,
+                       DataProcessor.ONCHAIN_DEPOSIT_STATUS, None)
+        statuses = [DataProcessor._normalize_flow_status(status, status_maps[g])
+                    for status, g in zip(records['status'].fillna('').tolist(), group.tolist())]
+
+        flows = pd.DataFrame({
+            "Coin": records['coin'].fillna(''),
+            "Direction": np.where(group < 2, "Deposit", "Withdrawal"),
+            "Network": np.where(is_internal, "Off-chain", "On-chain"),
+            "Amount": records['amount'].fillna(''),
+            # Internal deposits carry an email/phone address instead of a chain
+            "Chain/Address": records['address'].where(is_internal, records['chain']).fillna(''),
+            "Status": pd.Series(statuses, dtype=object),
+            "TX ID": records['txID'].fillna(''),
+        }).iloc[order]
+        flows.insert(headers.index("Time"), "Time", _format_epoch_ms(
+            kept_ms, '%Y-%m-%d %H:%M:%S'))
+
+        return headers, list(flows.itertuples(index=False, name=None))
 
-        if not all_flows:
-            return []
-
-        print(
-            f"   - Processing {len(all_flows)} transactions for 'Wallet Flows'...")
-
-        flow_data = []
-        for flow in all_flows:
-            # Check if it's an internal deposit (has 'type' field with value 1)
-            is_internal_deposit = flow.get('type') == 1
-
-            # 'successAt' is present for on-chain deposits, but not for withdrawals or internal deposits
-            is_onchain_deposit = 'successAt' in flow
-
-            # Determine direction and network
-            if is_internal_deposit:
-                direction = "Deposit"
-                network = "Off-chain"
-            elif is_onchain_deposit:
-                direction = "Deposit"
-                network = "On-chain"
-            else:
-                direction = "Withdrawal"
-                network = "On-chain"
-
-            try:
-                # Get timestamp based on transaction type
-                if is_internal_deposit:
-                    # Internal deposits use 'createdTime' (in seconds, not milliseconds)
-                    timestamp_ms = int(flow.get('createdTime', 0)) * 1000
-                else:
-                    # On-chain: use 'successAt' for deposits or 'updateTime' for withdrawals
-                    timestamp_ms = int(flow.get('successAt')
-                                       or flow.get('updateTime', 0))
-
-                # Handle cases where the timestamp might still be zero
-                if timestamp_ms == 0:
-                    print(
-                        f"⚠️  Warning: Found a wallet transaction with a zero timestamp. Skipping.")
-                    continue
-
-                timestamp = datetime.fromtimestamp(
-                    timestamp_ms/1000).strftime('%Y-%m-%d %H:%M:%S')
-
-                # Get status and normalize it
-                status = flow.get('status', '')
-
-                # Internal deposits use numeric status codes
-                if is_internal_deposit and isinstance(status, int):
-                    internal_status_map = {
-                        1: 'Processing',
-                        2: 'Success',
-                        3: 'Failed'
-                    }
-                    status = internal_status_map.get(status, str(status))
-
-                # On-chain deposits use numeric status codes
-                elif is_onchain_deposit and isinstance(status, int):
-                    onchain_deposit_status_map = {
-                        0: 'Unknown',
-                        1: 'To Be Confirmed',
-                        2: 'Processing',
-                        3: 'Success',
-                        4: 'Failed',
-                        10011: 'Pending Credit to Funding Pool',
-                        10012: 'Credited to Funding Pool'
-                    }
-                    status = onchain_deposit_status_map.get(
-                        status, str(status))
-
-                # Withdrawals use string status - normalize capitalization
-                elif isinstance(status, str):
-                    status = status.capitalize()
-
-                # For internal deposits, address is email/phone, otherwise it's blockchain chain
-                if is_internal_deposit:
-                    chain_or_address = flow.get('address', '')
-                    tx_id = flow.get('txID', '')
-                else:
-                    chain_or_address = flow.get('chain', '')
-                    tx_id = flow.get('txID', '')
-
-                flow_data.append({
-                    "Coin": flow.get('coin', ''),
-                    "Direction": direction,
-                    "Network": network,
-                    "Amount": flow.get('amount', ''),
-                    "Chain/Address": chain_or_address,
-                    "Status": status,
-                    "Time": timestamp,
-                    "TX ID": tx_id,
-                })
-            except Exception as e:
-                print(f"⚠️  Error processing wallet flow: {e}")
-                continue
-
-        return sorted(flow_data, key=lambda x: x['Time'], reverse=True)
+    @staticmethod
+    def _normalize_flow_status(status, status_map: Optional[Dict[int, str]]):
+        """Deposits use numeric status codes, withdrawals use strings - normalize capitalization"""
+        if status_map is not None and isinstance(status, int):
+            return status_map.get(status, str(status))
+        if isinstance(status, str):
+            return status.capitalize()
+        return status
 
     @staticmethod
-    def process_internal_transfer_data(transfers: List[Dict]) -> List[Dict]:
+    def process_internal_transfer_data(transfers: List[Dict]) -> Tuple[Tuple[str, ...], List[tuple]]:
         """
         Processes internal transfer records to create the 'Internal Transfers' log.
+        Returns (INTERNAL_TRANSFER_HEADERS, rows) with each row in header order.
         """
+        headers = DataProcessor.INTERNAL_TRANSFER_HEADERS
         if not transfers:
-            return []
+            return headers, []
 
-        print(
+        DataProcessor._progress.log(
             f"   - Processing {len(transfers)} internal transfers for 'Internal Transfers'...")
 
-        transfer_log = []
-        for transfer in transfers:
-            try:
-                timestamp_ms = int(transfer.get('timestamp', 0))
-                if timestamp_ms == 0:
-                    print(
-                        "⚠️  Warning: Found a transfer with a zero timestamp. Skipping.")
-                    continue
-
-                timestamp = datetime.fromtimestamp(
-                    timestamp_ms/1000).strftime('%Y-%m-%d %H:%M:%S')
-
-                transfer_log.append({
-                    "Time": timestamp,
-                    "Coin": transfer.get('coin', ''),
-                    "Amount": transfer.get('amount', ''),
-                    "From Account": transfer.get('fromAccountType', ''),
-                    "To Account": transfer.get('toAccountType', ''),
-                    "Status": transfer.get('status', ''),
-                })
-            except Exception as e:
-                print(f"⚠️  Error processing internal transfer: {e}")
-                continue
-
-        return sorted(transfer_log, key=lambda x: x['Time'], reverse=True)
+        # Field order after the timestamp matches the headers following the leading Time column
+        records = pd.DataFrame(transfers, dtype=object).reindex(
+            columns=['timestamp', 'coin', 'amount', 'fromAccountType', 'toAccountType', 'status'])
+        timestamps_ms = _parse_epoch_ms(records.pop('timestamp').fillna(0))
+        order = _usable_newest_first(timestamps_ms, "internal transfers")
+
+        transfer_log = records.iloc[order].fillna('')
+        transfer_log.insert(0, "Time", _format_epoch_ms(
+            timestamps_ms[order].astype(np.int64), '%Y-%m-%d %H:%M:%S'))
+        return headers, list(transfer_log.itertuples(index=False, name=None))
 
     @staticmethod
-    def process_universal_transfer_data(transfers: List[Dict]) -> List[Dict]:
+    def process_universal_transfer_data(transfers: List[Dict]) -> Tuple[Tuple[str, ...], List[tuple]]:
         """
         Processes universal transfer records to create the 'Universal Transfers' log.
+        Returns (UNIVERSAL_TRANSFER_HEADERS, rows) with each row in header order.
         """
+        headers = DataProcessor.UNIVERSAL_TRANSFER_HEADERS
         if not transfers:
-            return []
+            return headers, []
 
-        print(
+        DataProcessor._progress.log(
             f"   - Processing {len(transfers)} universal transfers for 'Universal Transfers'...")
 
-        transfer_log = []
-        for transfer in transfers:
-            try:
-                timestamp_ms = int(transfer.get('timestamp', 0))
-                if timestamp_ms == 0:
-                    print(
-                        "⚠️  Warning: Found a universal transfer with a zero timestamp. Skipping.")
-                    continue
-
-                timestamp = datetime.fromtimestamp(
-                    timestamp_ms/1000).strftime('%Y-%m-%d %H:%M:%S')
-
-                transfer_log.append({
-                    "Time": timestamp,
-                    "Transfer ID": transfer.get('transferId', ''),
-                    "Coin": transfer.get('coin', ''),
-                    "Amount": transfer.get('amount', ''),
-                    "From Member ID": transfer.get('fromMemberId', ''),
-                    "To Member ID": transfer.get('toMemberId', ''),
-                    "From Account": transfer.get('fromAccountType', ''),
-                    "To Account": transfer.get('toAccountType', ''),
-                    "Status": transfer.get('status', ''),
-                })
-            except Exception as e:
-                print(f"⚠️  Error processing universal transfer: {e}")
-                continue
-
-        return sorted(transfer_log, key=lambda x: x['Time'], reverse=True)
+        # Field order after the timestamp matches the headers following the leading Time column
+        records = pd.DataFrame(transfers, dtype=object).reindex(
+            columns=['timestamp', 'transferId', 'coin', 'amount', 'fromMemberId',
+                     'toMemberId', 'fromAccountType', 'toAccountType', 'status'])
+        timestamps_ms = _parse_epoch_ms(records.pop('timestamp').fillna(0))
+        order = _usable_newest_first(timestamps_ms, "universal transfers")
+
+        transfer_log = records.iloc[order].fillna('')
+        transfer_log.insert(0, "Time", _format_epoch_ms(
+            timestamps_ms[order].astype(np.int64), '%Y-%m-%d %H:%M:%S'))
+        return headers, list(transfer_log.itertuples(index=False, name=None))
 
     @staticmethod
-    def process_convert_history_data(conversions: List[Dict]) -> List[Dict]:
+    def process_convert_history_data(conversions: List[Dict]) -> Tuple[Tuple[str, ...], List[tuple]]:
         """
         Processes convert history records to create the 'Convert History' log.
+        Returns (CONVERT_HISTORY_HEADERS, rows) with each row in header order.
         """
+        headers = DataProcessor.CONVERT_HISTORY_HEADERS
         if not conversions:
-            return []
+            return headers, []
 
-        print(
+        DataProcessor._progress.log(
             f"   - Processing {len(conversions)} conversions for 'Convert History'...")
 
-        conversion_log = []
-        for conversion in conversions:
-            try:
-                timestamp_ms = int(conversion.get('createdAt', 0))
-                if timestamp_ms == 0:
-                    print(
-                        "⚠️  Warning: Found a conversion with a zero timestamp. Skipping.")
-                    continue
-
-                timestamp = datetime.fromtimestamp(
-                    timestamp_ms/1000).strftime('%Y-%m-%d %H:%M:%S')
-
-                # Format the conversion rate for better readability
-                convert_rate = conversion.get('convertRate', '')
-                if convert_rate:
-                    try:
-                        rate_float = float(convert_rate)
-                        convert_rate = f"{rate_float:.8f}".rstrip(
-                            '0').rstrip('.')
-                    except ValueError:
-                        pass
-
-                conversion_log.append({
-                    "Time": timestamp,
-                    "Exchange TX ID": conversion.get('exchangeTxId', ''),
-                    "From Coin": conversion.get('fromCoin', ''),
-                    "To Coin": conversion.get('toCoin', ''),
-                    "From Amount": conversion.get('fromAmount', ''),
-                    "To Amount": conversion.get('toAmount', ''),
-                    "Convert Rate": convert_rate,
-                    "Account Type": conversion.get('accountType', ''),
-                    "Status": conversion.get('exchangeStatus', ''),
-                })
-            except Exception as e:
-                print(f"⚠️  Error processing conversion: {e}")
-                continue
-
-        return sorted(conversion_log, key=lambda x: x['Time'], reverse=True)
+        # Field order after the timestamp matches the headers following the leading Time column
+        records = pd.DataFrame(conversions, dtype=object).reindex(
+            columns=['createdAt', 'exchangeTxId', 'fromCoin', 'toCoin', 'fromAmount',
+                     'toAmount', 'convertRate', 'accountType', 'exchangeStatus'])
+        timestamps_ms = _parse_epoch_ms(records.pop('createdAt').fillna(0))
+        order = _usable_newest_first(timestamps_ms, "conversions")
+
+        conversion_log = records.iloc[order].fillna('')
+        # Format the conversion rate for better readability; non-numeric rates are kept as-is
+        rates = pd.to_numeric(conversion_log['convertRate'], errors='coerce')
+        parsed = rates.notna()
+        conversion_log.loc[parsed, 'convertRate'] = np.char.rstrip(np.char.rstrip(
+            np.char.mod('%.8f', rates[parsed].to_numpy(dtype=np.float64)), '0'), '.').tolist()
+        conversion_log.insert(0, "Time", _format_epoch_ms(
+            timestamps_ms[order].astype(np.int64), '%Y-%m-%d %H:%M:%S'))
+        return headers, list(conversion_log.itertuples(index=False, name=None))
 
     @staticmethod
-    def process_asset_allocation(wallet_balance_unified: Optional[Dict], wallet_balance_fund: Optional[Dict]) -> List[Dict]:
+    def process_asset_allocation(wallet_balance_unified: Optional[Dict], wallet_balance_fund: Optional[Dict]) -> Tuple[Tuple[str, ...], List[tuple]]:
         """
         Processes wallet balance data from both UNIFIED and FUND wallets to create asset allocation data.
         Extracts coin information from both wallet balance responses.
-        Returns list sorted by USD value (largest first) with percentage calculations based on combined total USD value.
+        Returns (ASSET_ALLOCATION_HEADERS, rows) sorted by USD value (largest first) with percentage
+        calculations based on combined total USD value.
 
         Args:
             wallet_balance_unified: UNIFIED account wallet balance
@@ -460,7 +524,7 @@ class DataProcessor:
             if account_list:
                 unified_coins = account_list[0].get('coin', [])
                 if unified_coins:
-                    print(
+                    DataProcessor._progress.log(
                         f"   - Processing {len(unified_coins)} UNIFIED wallet coins...")
                     for coin in unified_coins:
                         try:
@@ -494,7 +558,7 @@ class DataProcessor:
         if wallet_balance_fund:
             fund_coins = wallet_balance_fund.get('balance', [])
             if fund_coins:
-                print(
+                DataProcessor._progress.log(
                     f"   - Processing {len(fund_coins)} FUND wallet coins...")
                 for coin in fund_coins:
                     try:
@@ -520,30 +584,22 @@ class DataProcessor:
                             f"⚠️  Error processing FUND balance for {coin.get('coin', 'Unknown')}: {e}")
                         continue
 
-        # Calculate percentages based on combined USD value and format data
+        # Sort by USD value (largest first), then calculate percentages and format rows
+        assets_with_balance.sort(key=lambda x: x['usdValue'], reverse=True)
         asset_allocation = []
         for asset in assets_with_balance:
             percentage = (asset['usdValue'] /
                           total_usd_value * 100) if total_usd_value > 0 else 0
-            asset_allocation.append({
-                'Coin': asset['coin'],
-                'Balance': f"{asset['walletBalance']:.8f}".rstrip('0').rstrip('.'),
-                'USD Value': f"${asset['usdValue']:.2f}",
-                'Percentage': f"{percentage:.2f}%",
-                'Wallet': asset['wallet'],
-                'Unrealised PnL': f"{asset['unrealisedPnl']:+.8f}".rstrip('0').rstrip('.') if asset['unrealisedPnl'] != 0 else "0",
-                'Cumulative Realised PnL': f"{asset['cumRealisedPnl']:+.8f}".rstrip('0').rstrip('.') if asset['cumRealisedPnl'] != 0 else "0",
-                '_usd_value': asset['usdValue'],  # For sorting
-                '_percentage_value': percentage  # For chart
-            })
-
-        # Sort by USD value (largest first)
-        sorted_allocation = sorted(
-            asset_allocation,
-            key=lambda x: x['_usd_value'],
-            reverse=True
-        )
-
-        print(
-            f"   - Found {len(sorted_allocation)} coins with non-zero balance (Total: ${total_usd_value:.2f})")
-        return sorted_allocation
+            asset_allocation.append((
+                asset['coin'],
+                _FMT8(asset['walletBalance']).rstrip('0').rstrip('.'),
+                f"${asset['usdValue']:.2f}",
+                f"{percentage:.2f}%",
+                asset['wallet'],
+                _FMT8_SIGNED(asset['unrealisedPnl']).rstrip('0').rstrip('.') if asset['unrealisedPnl'] != 0 else "0",
+                _FMT8_SIGNED(asset['cumRealisedPnl']).rstrip('0').rstrip('.') if asset['cumRealisedPnl'] != 0 else "0",
+            ))
+
+        DataProcessor._progress.log(
+            f"   - Found {len(asset_allocation)} coins with non-zero balance (Total: ${total_usd_value:.2f})")
+        return DataProcessor.ASSET_ALLOCATION_HEADERS, asset_allocation
@@ -3,7 +3,6 @@
 
 from bybit_service import BybitService
 from data_processor import DataProcessor
-import json
 
 
 def main():
@@ -55,9 +54,10 @@ def main():
     print("-" * 50)
 
     if fund_result and unified_result:
-        asset_allocation = DataProcessor.process_asset_allocation(
+        _, asset_allocation = DataProcessor.process_asset_allocation(
             unified_result, fund_result
         )
+        DataProcessor.flush_progress()
 
         print(f"\n✅ Asset Allocation processed successfully!")
         print(f"\nTop assets by USD value:")
@@ -65,11 +65,7 @@ def main():
         print("-" * 75)
 
         for asset in asset_allocation[:10]:  # Show top 10
-            coin = asset['Coin']
-            wallet = asset['Wallet']
-            balance = asset['Balance']
-            usd_value = asset['USD Value']
-            percentage = asset['Percentage']
+            coin, balance, usd_value, percentage, wallet = asset[:5]
             print(f"{coin:<10} {wallet:<10} {balance:<20} {usd_value:<15} {percentage:<10}")
 
         if len(asset_allocation) > 10:
@@ -1,18 +1,231 @@
+import asyncio
 import os
+import threading
 import time
 import gspread
-from gspread.utils import ValueInputOption
+import orjson
+from gspread.http_client import HTTPClient
+from gspread.utils import ValueInputOption, a1_range_to_grid_range, absolute_range_name, rowcol_to_a1
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
 from config import Config
 
 
+# Static request fragments, built once at import; only sheet ids/ranges vary per call
+_HEADER_CELL = {'userEnteredFormat': {
+    'textFormat': {'bold': True},
+    'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
+}}
+_HEADER_FIELDS = 'userEnteredFormat(textFormat.bold,backgroundColor)'
+
+_PROFIT_BG = {'backgroundColor': {'red': 0.7, 'green': 1.0, 'blue': 0.7}}
+_LOSS_BG = {'backgroundColor': {'red': 1.0, 'green': 0.7, 'blue': 0.7}}
+_BUY_TEXT = {'textFormat': {'foregroundColor': {
+    'red': 0.0, 'green': 0.6, 'blue': 0.0}}}  # Dark green text
+_SELL_TEXT = {'textFormat': {'foregroundColor': {
+    'red': 0.8, 'green': 0.0, 'blue': 0.0}}}  # Dark red text
+
+# Larger overwrites are sent in blocks of this many rows to bound the request payload size
+_WRITE_CHUNK_ROWS = 2000
+
+
+class _TokenBucket:
+    """Thread-safe token bucket pacing callers to `rate` acquisitions per `per` seconds"""
+
+    def __init__(self, rate: int, per: float):
+        self.capacity = rate
+        self.tokens = float(rate)
+        self.fill_rate = rate / per
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens +
+                              (now - self.updated) * self.fill_rate)
+            self.updated = now
+            # A missing token is reserved ahead, so concurrent callers queue up in order
+            wait = (1 - self.tokens) / self.fill_rate if self.tokens < 1 else 0
+            self.tokens -= 1
+        if wait:
+            time.sleep(wait)
+
+
+# Sheets API per-user quotas (60 read and 60 write requests per minute, counted separately),
+# shared by every thread in the process
+_SHEETS_READ_QUOTA = _TokenBucket(60, 60)
+_SHEETS_WRITE_QUOTA = _TokenBucket(60, 60)
+
+
+class _RateLimitRetryClient(HTTPClient):
+    """
+    HTTP client that paces Sheets API calls under the per-user read and write quotas and
+    retries calls rejected with 429 (rate limited), backing off exponentially.
+    GETs count against the read quota and every other method against the write quota.
+    Bursts within a quota go out immediately; callers only wait when it would be exceeded.
+    JSON bodies are encoded with orjson, which matters for large value writes.
+    """
+    MAX_ATTEMPTS = 6
+    MAX_WAIT = 30
+
+    def request(self, method, *args, **kwargs):
+        quota = _SHEETS_READ_QUOTA if method.lower() == 'get' else _SHEETS_WRITE_QUOTA
+        body = kwargs.pop('json', None)
+        if body is not None:
+            kwargs['data'] = orjson.dumps(body, option=orjson.OPT_SERIALIZE_NUMPY)
+            kwargs['headers'] = {**(kwargs.get('headers') or {}),
+                                 'Content-Type': 'application/json'}
+        for attempt in range(self.MAX_ATTEMPTS):
+            quota.acquire()
+            try:
+                return super().request(method, *args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                if e.code != 429 or attempt == self.MAX_ATTEMPTS - 1:
+                    raise
+                wait = min(2 ** attempt, self.MAX_WAIT)
+                print(f"⏳ Sheets API rate limit hit, retrying in {wait}s...")
+                time.sleep(wait)
+
+
+def _authorized_session(creds: Credentials) -> AuthorizedSession:
+    """
+    Session with a connection pool sized for the concurrent sheet refreshes, so connections
+    stay alive across calls. Transient 5xx errors on idempotent requests are retried with
+    backoff; 429s are left to _RateLimitRetryClient.
+    """
+    session = AuthorizedSession(creds)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=Retry(
+        total=5, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]))
+    session.mount("https://", adapter)
+    return session
+
+
+# Authorized clients and their service account email, keyed by (credentials file, mtime),
+# so every service instance in a process shares one parsed key and client until the file changes
+_GC_CACHE: Dict[Tuple[str, float], Tuple[gspread.Client, str]] = {}
+
+
+def _header_index(headers: Sequence[str]) -> Dict[str, int]:
+    """Maps each header to its 0-based column index"""
+    return {h: i for i, h in enumerate(headers)}
+
+
+def _conditional_format_rules(sheet_id: int, headers: Sequence[str]) -> List[Dict]:
+    """
+    Builds conditional format rules for the Side (Buy/Sell text colour) and PnL (profit/loss
+    background) columns. Ranges are open-ended, so rows written later are covered too.
+    """
+    index = _header_index(headers)
+
+    def column_rule(column: str, condition_type: str, value: str, cell_format: Dict) -> Dict:
+        col_idx = index[column]
+        return {
+            'ranges': [{'sheetId': sheet_id, 'startRowIndex': 1,
+                        'startColumnIndex': col_idx, 'endColumnIndex': col_idx + 1}],
+            'booleanRule': {
+                'condition': {'type': condition_type, 'values': [{'userEnteredValue': value}]},
+                'format': cell_format
+            }
+        }
+
+    rules = []
+    if "Side" in index:
+        rules.append(column_rule("Side", 'TEXT_EQ', "Buy", _BUY_TEXT))
+        rules.append(column_rule("Side", 'TEXT_EQ', "Sell", _SELL_TEXT))
+    if "PnL" in index:
+        rules.append(column_rule("PnL", 'NUMBER_GREATER', "0", _PROFIT_BG))
+        rules.append(column_rule("PnL", 'NUMBER_LESS', "0", _LOSS_BG))
+    return rules
+
+
+# (condition type, values) of every rule _conditional_format_rules can generate
+_OWNED_CONDITIONS = frozenset({('TEXT_EQ', ('Buy',)), ('TEXT_EQ', ('Sell',)),
+                               ('NUMBER_GREATER', ('0',)), ('NUMBER_LESS', ('0',))})
+
+
+def _is_owned_rule(rule: Dict, sheet_id: int) -> bool:
+    """
+    Whether an existing conditional format rule is one _conditional_format_rules generates:
+    a Side/PnL condition on a single open-ended column of the sheet. Rules added by users
+    (other ranges or conditions) are left alone.
+    """
+    ranges = rule.get('ranges', [])
+    if len(ranges) != 1:
+        return False
+    grid = ranges[0]
+    if (grid.get('sheetId', 0) != sheet_id or grid.get('startRowIndex', 0) != 1
+            or 'endRowIndex' in grid
+            or grid.get('endColumnIndex', 0) - grid.get('startColumnIndex', 0) != 1):
+        return False
+    condition = rule.get('booleanRule', {}).get('condition', {})
+    values = [v.get('userEnteredValue') for v in condition.get('values', [])]
+    return (condition.get('type'), tuple(values)) in _OWNED_CONDITIONS
+
+
+def _canonical_rule(value):
+    """
+    Normalizes a conditional format rule for comparison with the one the API echoes back:
+    the API omits zero values, adds *Style twins of colours and may round floats.
+    """
+    if isinstance(value, dict):
+        return {k: _canonical_rule(v) for k, v in value.items()
+                if not k.endswith('Style') and v not in (0, None)}
+    if isinstance(value, list):
+        return [_canonical_rule(v) for v in value]
+    if isinstance(value, float):
+        return round(value, 2)
+    return value
+
+
+def _project(headers: Sequence[str]):
+    """Builds a function mapping a dict record to a row in header order, blank for missing keys"""
+    index = _header_index(headers)
+    width = len(headers)
+
+    def project(row_dict: Dict) -> List:
+        row = [""] * width
+        for key, value in row_dict.items():
+            i = index.get(key)
+            if i is not None:
+                row[i] = value
+        return row
+    return project
+
+
+def _as_rows(data: List[Union[Dict, Sequence]], headers: Sequence[str]) -> List[Sequence]:
+    """Projects dict records onto headers; rows already in header order are passed through as-is"""
+    if data and isinstance(data[0], dict):
+        project = _project(headers)
+        return [project(row_dict) for row_dict in data]
+    return data
+
+
 class GoogleSheetsService:
     """Service for interacting with Google Sheets API"""
 
     def __init__(self):
         self.gc = None
         self.spreadsheet = None
+        self._client_email: Optional[str] = None
+        # Worksheets already resolved on this spreadsheet, by title
+        self._ws_cache: Dict[str, gspread.Worksheet] = {}
+        # Whether _ws_cache holds every worksheet of the spreadsheet, from one worksheets() listing
+        self._ws_cache_primed = False
+        self._ws_lock = threading.Lock()
+        # (rows, cols) written by the last overwrite of each sheet, including the header row
+        self._last_row_counts: Dict[str, Tuple[int, int]] = {}
+        # Sheets created in this run whose header row goes out with their first append
+        self._header_pending: Set[str] = set()
+        # Sheets appended to or overwritten in this run, so their format rules are already in place
+        self._written_sheets: Set[str] = set()
+        self._append_lock = threading.Lock()
+        # batchUpdate requests queued by the current operation, per thread so that
+        # concurrent sheet refreshes each flush only their own requests
+        self._pending = threading.local()
         self.setup_connection()
 
     def setup_connection(self) -> bool:
@@ -21,11 +234,18 @@ class GoogleSheetsService:
                 print(
                     f"❌ Google credentials file not found: {Config.GOOGLE_CREDENTIALS_FILE}")
                 return False
-            scope = ["https://www.googleapis.com/auth/spreadsheets",
-                     "https://www.googleapis.com/auth/drive"]
-            creds = Credentials.from_service_account_file(
-                Config.GOOGLE_CREDENTIALS_FILE, scopes=scope)
-            self.gc = gspread.authorize(creds)
+            key = (Config.GOOGLE_CREDENTIALS_FILE,
+                   os.path.getmtime(Config.GOOGLE_CREDENTIALS_FILE))
+            if key not in _GC_CACHE:
+                scope = ["https://www.googleapis.com/auth/spreadsheets",
+                         "https://www.googleapis.com/auth/drive"]
+                creds = Credentials.from_service_account_file(
+                    Config.GOOGLE_CREDENTIALS_FILE, scopes=scope)
+                # Taken from the already parsed key, so the file is never re-read for it
+                _GC_CACHE[key] = (gspread.authorize(
+                    creds, http_client=_RateLimitRetryClient, session=_authorized_session(creds)),
+                    creds.service_account_email)
+            self.gc, self._client_email = _GC_CACHE[key]
             print("✅ Google Sheets API connected")
             return True
         except Exception as e:
@@ -39,301 +259,409 @@ class GoogleSheetsService:
             if Config.GOOGLE_SPREADSHEET_ID:
                 self.spreadsheet = self.gc.open_by_key(
                     Config.GOOGLE_SPREADSHEET_ID)
+                self.invalidate_cache()
+                with self._ws_lock:
+                    self._prime_worksheet_cache()
                 print(
                     f"✅ Connected to spreadsheet by ID: {self.spreadsheet.title}")
                 return True
             # ... [rest of the function is the same]
         except Exception as e:
             print(f"❌ Error connecting to spreadsheet: {e}")
+            client_email = self.get_service_account_email()
+            if client_email:
+                print(
+                    f"💡 Tip: Make sure the spreadsheet is shared with {client_email}")
             return False
         return False
 
-    def format_headers(self, worksheet: gspread.Worksheet):
+    def get_service_account_email(self) -> Optional[str]:
+        """Returns the service account email the spreadsheet must be shared with"""
+        return self._client_email
+
+    def _enqueue(self, *requests: Dict):
+        """Queues batchUpdate requests to be sent by the next _flush() on this thread"""
+        pending = getattr(self._pending, 'requests', None)
+        if pending is None:
+            pending = self._pending.requests = []
+        pending.extend(requests)
+
+    def _flush(self):
+        """Sends all queued requests of this thread as a single batchUpdate call"""
+        requests = getattr(self._pending, 'requests', None)
+        # Dropped before sending, so a failed batch isn't resent with the next one
+        self._pending.requests = []
+        if requests:
+            self.spreadsheet.batch_update({'requests': requests})
+
+    def format_headers(self, worksheet: gspread.Worksheet, column_count: Optional[int] = None):
         if not Config.ENABLE_FORMATTING:
             return
         try:
-            worksheet.format('1:1', {'textFormat': {'bold': True}, 'backgroundColor': {
-                             'red': 0.9, 'green': 0.9, 'blue': 0.9}})
+            self._enqueue(self._header_format_request(worksheet, column_count))
+            self._flush()
         except Exception as e:
             print(f"⚠️  Could not apply header formatting: {e}")
 
-    def apply_conditional_formatting(self, worksheet: gspread.Worksheet, headers: List[str]):
-        """Apply conditional formatting for Side and PnL columns using efficient batch operations"""
-        if not Config.ENABLE_FORMATTING:
-            return
-
-        try:
-            # Get column indices for Side and PnL
-            side_col_idx = None
-            pnl_col_idx = None
-
-            for i, header in enumerate(headers):
-                if header == "Side":
-                    side_col_idx = i + 1  # gspread uses 1-based indexing
-                elif header == "PnL":
-                    pnl_col_idx = i + 1
-
-            # Get all data at once to minimize API calls
-            all_data = worksheet.get_all_values()
-            if len(all_data) < 2:  # No data rows to format
-                return
-
-            # Group cells by color to create ranges
-            buy_ranges = []
-            sell_ranges = []
-            profit_ranges = []
-            loss_ranges = []
-
-            # Process Side column
-            if side_col_idx:
-                side_col_letter = chr(64 + side_col_idx)
-                current_buy_start = None
-                current_sell_start = None
-
-                # Skip header
-                for row_idx, row_data in enumerate(all_data[1:], start=2):
-                    side_value = row_data[side_col_idx -
-                                          1] if len(row_data) > side_col_idx - 1 else ""
-
-                    if side_value == "Buy":
-                        if current_buy_start is None:
-                            current_buy_start = row_idx
-                        # Close any ongoing sell range
-                        if current_sell_start is not None:
-                            sell_ranges.append(
-                                f"{side_col_letter}{current_sell_start}:{side_col_letter}{row_idx - 1}")
-                            current_sell_start = None
-                    elif side_value == "Sell":
-                        if current_sell_start is None:
-                            current_sell_start = row_idx
-                        # Close any ongoing buy range
-                        if current_buy_start is not None:
-                            buy_ranges.append(
-                                f"{side_col_letter}{current_buy_start}:{side_col_letter}{row_idx - 1}")
-                            current_buy_start = None
-                    else:
-                        # Close both ranges if we hit a different value
-                        if current_buy_start is not None:
-                            buy_ranges.append(
-                                f"{side_col_letter}{current_buy_start}:{side_col_letter}{row_idx - 1}")
-                            current_buy_start = None
-                        if current_sell_start is not None:
-                            sell_ranges.append(
-                                f"{side_col_letter}{current_sell_start}:{side_col_letter}{row_idx - 1}")
-                            current_sell_start = None
-
-                # Close any remaining ranges
-                last_row = len(all_data)
-                if current_buy_start is not None:
-                    buy_ranges.append(
-                        f"{side_col_letter}{current_buy_start}:{side_col_letter}{last_row}")
-                if current_sell_start is not None:
-                    sell_ranges.append(
-                        f"{side_col_letter}{current_sell_start}:{side_col_letter}{last_row}")
-
-            # Process PnL column
-            if pnl_col_idx:
-                pnl_col_letter = chr(64 + pnl_col_idx)
-                current_profit_start = None
-                current_loss_start = None
-
-                # Skip header
-                for row_idx, row_data in enumerate(all_data[1:], start=2):
-                    pnl_value = row_data[pnl_col_idx -
-                                         1] if len(row_data) > pnl_col_idx - 1 else ""
-
-                    try:
-                        pnl_float = float(pnl_value)
-                        if pnl_float > 0:
-                            if current_profit_start is None:
-                                current_profit_start = row_idx
-                            # Close any ongoing loss range
-                            if current_loss_start is not None:
-                                loss_ranges.append(
-                                    f"{pnl_col_letter}{current_loss_start}:{pnl_col_letter}{row_idx - 1}")
-                                current_loss_start = None
-                        elif pnl_float < 0:
-                            if current_loss_start is None:
-                                current_loss_start = row_idx
-                            # Close any ongoing profit range
-                            if current_profit_start is not None:
-                                profit_ranges.append(
-                                    f"{pnl_col_letter}{current_profit_start}:{pnl_col_letter}{row_idx - 1}")
-                                current_profit_start = None
-                        else:
-                            # Zero value, close both ranges
-                            if current_profit_start is not None:
-                                profit_ranges.append(
-                                    f"{pnl_col_letter}{current_profit_start}:{pnl_col_letter}{row_idx - 1}")
-                                current_profit_start = None
-                            if current_loss_start is not None:
-                                loss_ranges.append(
-                                    f"{pnl_col_letter}{current_loss_start}:{pnl_col_letter}{row_idx - 1}")
-                                current_loss_start = None
-                    except (ValueError, TypeError):
-                        # Close both ranges on invalid value
-                        if current_profit_start is not None:
-                            profit_ranges.append(
-                                f"{pnl_col_letter}{current_profit_start}:{pnl_col_letter}{row_idx - 1}")
-                            current_profit_start = None
-                        if current_loss_start is not None:
-                            loss_ranges.append(
-                                f"{pnl_col_letter}{current_loss_start}:{pnl_col_letter}{row_idx - 1}")
-                            current_loss_start = None
-
-                # Close any remaining ranges
-                last_row = len(all_data)
-                if current_profit_start is not None:
-                    profit_ranges.append(
-                        f"{pnl_col_letter}{current_profit_start}:{pnl_col_letter}{last_row}")
-                if current_loss_start is not None:
-                    loss_ranges.append(
-                        f"{pnl_col_letter}{current_loss_start}:{pnl_col_letter}{last_row}")
-
-            # Apply formatting to ranges (much fewer API calls)
-            green_bg = {'backgroundColor': {
-                'red': 0.7, 'green': 1.0, 'blue': 0.7}}
-            red_bg = {'backgroundColor': {
-                'red': 1.0, 'green': 0.7, 'blue': 0.7}}
-
-            # Text colors for Side column
-            green_text = {'textFormat': {'foregroundColor': {
-                'red': 0.0, 'green': 0.6, 'blue': 0.0}}}  # Dark green text
-            red_text = {'textFormat': {'foregroundColor': {
-                'red': 0.8, 'green': 0.0, 'blue': 0.0}}}   # Dark red text
-
-            # Format Buy ranges (green text) - with longer delays to avoid rate limits
-            for range_str in buy_ranges:
-                try:
-                    worksheet.format(range_str, green_text)
-                    time.sleep(0.8)  # Increased delay between range operations
-                except Exception as e:
-                    print(f"⚠️  Could not format Buy range {range_str}: {e}")
-
-            # Format Sell ranges (red text)
-            for range_str in sell_ranges:
-                try:
-                    worksheet.format(range_str, red_text)
-                    time.sleep(0.8)  # Increased delay
-                except Exception as e:
-                    print(f"⚠️  Could not format Sell range {range_str}: {e}")
+    @staticmethod
+    def _header_format_request(worksheet: gspread.Worksheet, column_count: Optional[int] = None) -> Dict:
+        """
+        Builds a batchUpdate request that bolds and shades the header row.
+        With column_count the range stops at the last header instead of spanning the whole row.
+        """
+        grid_range = {'sheetId': worksheet.id,
+                      'startRowIndex': 0, 'endRowIndex': 1}
+        if column_count:
+            grid_range.update(startColumnIndex=0, endColumnIndex=column_count)
+        return {
+            'repeatCell': {
+                'range': grid_range,
+                'cell': _HEADER_CELL,
+                'fields': _HEADER_FIELDS
+            }
+        }
 
-            # Format Profit ranges (green)
-            for range_str in profit_ranges:
-                try:
-                    worksheet.format(range_str, green_bg)
-                    time.sleep(0.8)  # Increased delay
-                except Exception as e:
-                    print(
-                        f"⚠️  Could not format Profit range {range_str}: {e}")
+    def _batch_format(self, worksheet: gspread.Worksheet, format_ops: List[Tuple[str, Dict]]):
+        """
+        Queues several (A1 range, cell format) pairs for the next _flush().
+        Each pair becomes a repeatCell request with the same field mask worksheet.format() would use.
+        """
+        self._enqueue(*({
+            'repeatCell': {
+                'range': a1_range_to_grid_range(range_a1, worksheet.id),
+                'cell': {'userEnteredFormat': cell_format},
+                'fields': f"userEnteredFormat({','.join(cell_format)})"
+            }
+        } for range_a1, cell_format in format_ops))
 
-            # Format Loss ranges (red)
-            for range_str in loss_ranges:
-                try:
-                    worksheet.format(range_str, red_bg)
-                    time.sleep(0.8)  # Increased delay
-                except Exception as e:
-                    print(f"⚠️  Could not format Loss range {range_str}: {e}")
+    def apply_conditional_formatting(self, worksheet: gspread.Worksheet, headers: Sequence[str]) -> int:
+        """
+        Queues server-side conditional format rules for the Side and PnL columns; they are
+        registered by the next _flush(). Returns the number of rules queued.
+        Sheets evaluates them on every row, so no data has to be read back or scanned here.
+        """
+        if not Config.ENABLE_FORMATTING:
+            return 0
 
-            print(
-                f"✅ Applied formatting to {len(buy_ranges + sell_ranges + profit_ranges + loss_ranges)} ranges instead of individual cells")
+        try:
+            rules = _conditional_format_rules(worksheet.id, headers)
+            if not rules:
+                return 0
+
+            # Replace the rules registered by earlier syncs instead of stacking duplicates,
+            # keeping any rules users added themselves.
+            # Only this sheet's rule list is requested, not the whole spreadsheet's metadata.
+            metadata = self.spreadsheet.fetch_sheet_metadata(params={
+                'includeGridData': 'false',
+                'ranges': absolute_range_name(worksheet.title),
+                'fields': 'sheets(properties.sheetId,conditionalFormats)',
+            })
+            existing_rules = next(
+                (sheet.get('conditionalFormats', []) for sheet in metadata.get('sheets', [])
+                 if sheet['properties']['sheetId'] == worksheet.id), [])
+            owned = [index for index, rule in enumerate(existing_rules)
+                     if _is_owned_rule(rule, worksheet.id)]
+            # Rules are open-ended and independent of the data, so a previous sync's rules
+            # usually still apply as they are
+            if owned == list(range(len(rules))) and \
+                    _canonical_rule([existing_rules[i] for i in owned]) == _canonical_rule(rules):
+                print("✅ Conditional formatting rules already up to date")
+                return 0
+
+            self._enqueue(*({'deleteConditionalFormatRule': {'sheetId': worksheet.id, 'index': index}}
+                            for index in reversed(owned)))
+            self._enqueue(*({'addConditionalFormatRule': {'rule': rule, 'index': index}}
+                            for index, rule in enumerate(rules)))
+            return len(rules)
 
         except Exception as e:
             print(f"⚠️  Could not apply conditional formatting: {e}")
+            return 0
 
-    def get_or_create_worksheet(self, sheet_name: str, headers: Optional[List[str]] = None) -> Optional[gspread.Worksheet]:
+    def get_or_create_worksheet(self, sheet_name: str, headers: Optional[Sequence[str]] = None) -> Optional[gspread.Worksheet]:
         """
-        Gets an existing worksheet. If it does not exist, creates it and initializes it with headers.
+        Gets an existing worksheet. If it does not exist, creates it and prepares it for headers,
+        which append_data writes together with the first rows.
+        Resolved worksheets are cached, so repeated calls for the same sheet skip the API lookup.
+        All worksheets are listed in one request when connecting, so a title missing from the
+        cache is created straight away instead of being looked up first.
         """
         if not self.spreadsheet:
             return None
-        try:
-            # Try to get the worksheet
-            worksheet = self.spreadsheet.worksheet(sheet_name)
+        worksheet = self._ws_cache.get(sheet_name)
+        if worksheet is not None:
             return worksheet
-        except gspread.WorksheetNotFound:
-            # This block runs ONLY if the sheet does not exist
+        # Serialize cache misses so concurrent writers don't create the same sheet twice
+        with self._ws_lock:
+            worksheet = self._ws_cache.get(sheet_name)
+            if worksheet is None and not self._ws_cache_primed:
+                self._prime_worksheet_cache()
+                worksheet = self._ws_cache.get(sheet_name)
+            if worksheet is None:
+                worksheet = self._fetch_or_create_worksheet(
+                    sheet_name, headers, known_missing=self._ws_cache_primed)
+                if worksheet is not None:
+                    self._ws_cache[sheet_name] = worksheet
+            return worksheet
+
+    def _prime_worksheet_cache(self) -> None:
+        """Caches all existing worksheets by title from one metadata request"""
+        try:
+            for worksheet in self.spreadsheet.worksheets():
+                self._ws_cache.setdefault(worksheet.title, worksheet)
+            self._ws_cache_primed = True
+        except Exception as e:
+            print(f"⚠️  Could not list worksheets, falling back to per-sheet lookups: {e}")
+
+    def invalidate_cache(self) -> None:
+        """Forgets all cached worksheets and write extents, e.g. after sheets were recreated"""
+        with self._ws_lock:
+            self._ws_cache.clear()
+            self._ws_cache_primed = False
+        self._last_row_counts.clear()
+        self._header_pending.clear()
+        self._written_sheets.clear()
+
+    def invalidate_worksheet(self, sheet_name: str) -> None:
+        """Drops a cached worksheet, e.g. after it was deleted or renamed outside this service"""
+        self._ws_cache.pop(sheet_name, None)
+        self._last_row_counts.pop(sheet_name, None)
+        self._header_pending.discard(sheet_name)
+        self._written_sheets.discard(sheet_name)
+
+    def _fetch_or_create_worksheet(self, sheet_name: str, headers: Optional[Sequence[str]],
+                                   known_missing: bool = False) -> Optional[gspread.Worksheet]:
+        if not known_missing:
             try:
-                print(
-                    f"Worksheet '{sheet_name}' not found. Creating and initializing...")
-                worksheet = self.spreadsheet.add_worksheet(
-                    title=sheet_name, rows="1000", cols="30")
-                if headers:
-                    # Initialize with headers immediately upon creation
-                    worksheet.append_row(
-                        headers, value_input_option=ValueInputOption.user_entered)
-                    self.format_headers(worksheet)
-                print(
-                    f"✅ Created and initialized new worksheet: '{sheet_name}'")
-                return worksheet
-            except Exception as e:
-                print(f"❌ Error creating worksheet '{sheet_name}': {e}")
-                return None
-
-    def append_data(self, sheet_name: str, data: List[Dict], headers: List[str]) -> bool:
-        """Appends rows of data. Handles sheet creation and initialization."""
+                # Try to get the worksheet
+                return self.spreadsheet.worksheet(sheet_name)
+            except gspread.WorksheetNotFound:
+                pass
+        # This block runs ONLY if the sheet does not exist
+        try:
+            print(
+                f"Worksheet '{sheet_name}' not found. Creating and initializing...")
+            worksheet = self.spreadsheet.add_worksheet(
+                title=sheet_name, rows="1000", cols="30")
+            # Nothing written yet, so a first overwrite has no leftover cells to clear
+            self._last_row_counts[sheet_name] = (0, 0)
+            if headers:
+                # The new sheet is empty: the header row goes out with the first append's
+                # values (from row 1), and its formatting with that append's batchUpdate
+                self._header_pending.add(sheet_name)
+                if Config.ENABLE_FORMATTING:
+                    self._enqueue(self._header_format_request(worksheet, len(headers)))
+            print(
+                f"✅ Created and initialized new worksheet: '{sheet_name}'")
+            return worksheet
+        except Exception as e:
+            print(f"❌ Error creating worksheet '{sheet_name}': {e}")
+            return None
+
+    def append_data(self, sheet_name: str, data: List[Union[Dict, Sequence]], headers: Sequence[str]) -> bool:
+        """
+        Appends rows of data. Handles sheet creation and initialization.
+        Rows always go through values.append, which finds the end of the table server-side,
+        so rows added by other writers since our last append are never overwritten.
+        The first append to a sheet also makes sure its Side/PnL conditional format rules are
+        registered; they are open-ended, so every row appended afterwards is coloured too.
+        """
         if not data:
             return True
         try:
-            # This function now guarantees the sheet will exist and have headers
+            # Guarantees the sheet exists; a newly created one gets its header row below
             worksheet = self.get_or_create_worksheet(
                 sheet_name, headers=headers)
             if not worksheet:
                 return False
 
-            rows_to_add = []
-            for row_dict in data:
-                rows_to_add.append([row_dict.get(h, "") for h in headers])
-
-            worksheet.append_rows(
-                rows_to_add, value_input_option=ValueInputOption.user_entered)
+            rows_to_add = _as_rows(data, headers)
+            # Only one append may claim a new sheet's pending header row
+            with self._append_lock:
+                first_append = sheet_name not in self._written_sheets
+                if sheet_name in self._header_pending:
+                    rows_to_add = [list(headers), *rows_to_add]
+                worksheet.append_rows(
+                    rows_to_add, value_input_option=ValueInputOption.user_entered)
+                self._header_pending.discard(sheet_name)
+                self._written_sheets.add(sheet_name)
+                # The overwrite extent no longer covers the appended rows
+                self._last_row_counts.pop(sheet_name, None)
+
+            if first_append:
+                try:
+                    self.apply_conditional_formatting(worksheet, headers)
+                    self._flush()
+                except Exception as e:
+                    print(f"⚠️  Could not apply conditional formatting: {e}")
             return True
         except Exception as e:
             print(f"❌ Error appending data to '{sheet_name}': {e}")
             return False
 
-    def overwrite_data(self, sheet_name: str, data: List[Dict], headers: List[str]) -> bool:
-        """Clears a sheet and replaces its content with headers and new data."""
+    def _stale_ranges(self, sheet_name: str, worksheet: gspread.Worksheet,
+                      row_count: int, col_count: int) -> List[str]:
+        """
+        Lists the A1 ranges outside a new (row_count x col_count) extent that may still hold
+        old values: up to the previous write's extent when it is known, otherwise across the
+        worksheet's whole grid. Sheets created in this run have nothing to clear.
+        """
+        previous = self._last_row_counts.get(sheet_name)
+        rows, cols = previous if previous is not None else (worksheet.row_count, worksheet.col_count)
+        ranges = []
+        if rows and cols > col_count:
+            ranges.append(absolute_range_name(
+                sheet_name, f"{rowcol_to_a1(1, col_count + 1)}:{rowcol_to_a1(rows, cols)}"))
+        if rows > row_count and cols:
+            ranges.append(absolute_range_name(
+                sheet_name, f"A{row_count + 1}:{rowcol_to_a1(rows, min(cols, col_count))}"))
+        return ranges
+
+    def _clear_ranges(self, ranges: List[str]):
+        """Clears leftover values in one values.batchClear request, without sending any cells"""
+        if ranges:
+            self.spreadsheet.values_batch_clear(body={'ranges': ranges})
+
+    def _overwrite_blocks(self, sheet_name: str, data: List[Union[Dict, Sequence]],
+                          headers: Sequence[str]) -> Iterator[List[Dict]]:
+        """
+        Yields the value ranges of each write block replacing a sheet's content; the first
+        block carries the header row. Data beyond _WRITE_CHUNK_ROWS rows is projected one
+        block at a time.
+        """
+        for start in range(0, max(len(data), 1), _WRITE_CHUNK_ROWS):
+            chunk = _as_rows(data[start:start + _WRITE_CHUNK_ROWS], headers)
+            if start == 0:
+                yield [{'range': absolute_range_name(sheet_name, 'A1'),
+                        'values': [headers, *chunk]}]
+            else:
+                yield [{'range': absolute_range_name(sheet_name, f'A{start + 2}'),
+                        'values': chunk}]
+
+    @staticmethod
+    def _ensure_grid(worksheet: gspread.Worksheet, row_count: int, col_count: int):
+        """Grows the worksheet's grid, never shrinks it, so every write block fits inside it"""
+        if row_count > worksheet.row_count or col_count > worksheet.col_count:
+            worksheet.resize(rows=max(row_count, worksheet.row_count),
+                             cols=max(col_count, worksheet.col_count))
+
+    def _write_values(self, value_ranges: List[Dict]):
+        self.spreadsheet.values_batch_update({
+            'valueInputOption': ValueInputOption.user_entered,
+            'data': value_ranges
+        })
+
+    def _record_overwrite(self, sheet_name: str, data: List, headers: Sequence[str]):
+        """Remembers the extent just written, for blanking on later writes"""
+        self._last_row_counts[sheet_name] = (len(data) + 1, len(headers))
+        self._header_pending.discard(sheet_name)
+        self._written_sheets.add(sheet_name)
+
+    def _queue_sheet_formats(self, sheet_name: str, worksheet: gspread.Worksheet, headers: Sequence[str]) -> int:
+        """Queues the header format and, for futures and spot data, the conditional format rules"""
+        self._enqueue(self._header_format_request(worksheet, len(headers)))
+        if sheet_name in ["Futures History", "Spot History"]:
+            print("⏳ Applying conditional formatting...")
+            return self.apply_conditional_formatting(worksheet, headers)
+        return 0
+
+    def _flush_formats(self, rule_count: int):
         try:
-            # This guarantees the sheet exists and is initialized if new
-            worksheet = self.get_or_create_worksheet(
-                sheet_name, headers=headers)
+            self._flush()
+            if rule_count:
+                print(
+                    f"✅ Applied {rule_count} conditional formatting rules")
+        except Exception as e:
+            print(
+                f"⚠️  Formatting failed due to rate limits: {e}")
+            print(
+                "💡 Tip: You can disable formatting in config to speed up syncing")
+
+    def overwrite_data(self, sheet_name: str, data: List[Union[Dict, Sequence]], headers: Sequence[str]) -> bool:
+        """
+        Replaces a sheet's content with headers and new data; only cells outside the new
+        extent are cleared, so the sheet is never blank in between.
+        Header and conditional formats then go out together in one batchUpdate.
+        """
+        try:
+            # Headers are written (and formatted) below together with the data, so a newly
+            # created sheet doesn't need its own header row initialization
+            worksheet = self.get_or_create_worksheet(sheet_name)
             if not worksheet:
                 return False
 
-            worksheet.clear()
-
-            rows_to_write = [headers]
-            for row_dict in data:
-                rows_to_write.append([row_dict.get(h, "") for h in headers])
-
-            worksheet.update(
-                rows_to_write, value_input_option=ValueInputOption.user_entered)
+            # Leftover cells lie outside the new extent, so clearing them can't race the write
+            self._clear_ranges(self._stale_ranges(
+                sheet_name, worksheet, len(data) + 1, len(headers)))
+            self._ensure_grid(worksheet, len(data) + 1, len(headers))
+            for value_ranges in self._overwrite_blocks(sheet_name, data, headers):
+                self._write_values(value_ranges)
+            self._record_overwrite(sheet_name, data, headers)
 
-            # Add delay to avoid rate limits
-            time.sleep(1)
+            if Config.ENABLE_FORMATTING:
+                self._flush_formats(
+                    self._queue_sheet_formats(sheet_name, worksheet, headers))
 
-            self.format_headers(worksheet)
+            return True
+        except Exception as e:
+            print(f"❌ Error overwriting data in '{sheet_name}': {e}")
+            return False
 
-            # Apply conditional formatting for futures and spot data with additional delay
-            if sheet_name in ["Futures History", "Spot History"] and Config.ENABLE_FORMATTING:
-                print(
-                    "⏳ Applying conditional formatting (this may take a while due to rate limits)...")
-                time.sleep(3)  # Extra delay before formatting
-                try:
-                    self.apply_conditional_formatting(worksheet, headers)
-                except Exception as e:
-                    print(
-                        f"⚠️  Conditional formatting failed due to rate limits: {e}")
-                    print(
-                        "💡 Tip: You can disable formatting in config to speed up syncing")
+    def overwrite_many(self, jobs: List[Tuple[str, List[Union[Dict, Sequence]], Sequence[str]]]) -> bool:
+        """
+        Replaces the content of several sheets, given as (sheet_name, data, headers) jobs.
+        Leftover cells of all sheets are cleared in one values batchClear, the first block of
+        every sheet is written in one values batchUpdate and the formats
+        of all sheets are sent in one batchUpdate, so the request count doesn't grow with
+        the number of sheets (only sheets larger than _WRITE_CHUNK_ROWS add requests).
+        """
+        if not jobs:
+            return True
+        try:
+            targets = []
+            for sheet_name, data, headers in jobs:
+                worksheet = self.get_or_create_worksheet(sheet_name)
+                if not worksheet:
+                    return False
+                targets.append((sheet_name, worksheet, data, headers,
+                                self._overwrite_blocks(sheet_name, data, headers)))
+
+            self._clear_ranges([stale_range for sheet_name, worksheet, data, headers, _ in targets
+                                for stale_range in self._stale_ranges(
+                                    sheet_name, worksheet, len(data) + 1, len(headers))])
+            for _, worksheet, data, headers, _ in targets:
+                self._ensure_grid(worksheet, len(data) + 1, len(headers))
+            self._write_values(
+                [value_range for *_, blocks in targets for value_range in next(blocks)])
+            for sheet_name, _, data, headers, blocks in targets:
+                for value_ranges in blocks:
+                    self._write_values(value_ranges)
+                self._record_overwrite(sheet_name, data, headers)
+
+            if Config.ENABLE_FORMATTING:
+                self._flush_formats(sum(
+                    self._queue_sheet_formats(sheet_name, worksheet, headers)
+                    for sheet_name, worksheet, _, headers, _ in targets))
 
             return True
         except Exception as e:
-            print(f"❌ Error overwriting data in '{sheet_name}': {e}")
+            print(f"❌ Error overwriting sheets: {e}")
             return False
 
-    def overwrite_portfolio_overview(self, overview_data: Dict, asset_allocation: Optional[List[Dict]] = None) -> bool:
+    async def refresh_all(self, jobs: List[Tuple[str, List[Union[Dict, Sequence]], Sequence[str]]],
+                          overview_data: Optional[Dict] = None,
+                          asset_allocation: Optional[List[Sequence]] = None) -> List[bool]:
+        """
+        Writes every (sheet_name, data, headers) job with one overwrite_many call, concurrently
+        with the Portfolio Overview refresh when overview data is given.
+        """
+        tasks = [asyncio.to_thread(self.overwrite_many, jobs)]
+        if overview_data:
+            tasks.append(asyncio.to_thread(
+                self.overwrite_portfolio_overview, overview_data, asset_allocation))
+        return await asyncio.gather(*tasks)
+
+    def overwrite_portfolio_overview(self, overview_data: Dict, asset_allocation: Optional[List[Sequence]] = None) -> bool:
         """
         Creates or overwrites a sheet with portfolio overview metrics and asset allocation.
         """
@@ -342,8 +670,8 @@ class GoogleSheetsService:
 
         sheet_name = "Portfolio Overview"
         try:
-            worksheet = self.get_or_create_worksheet(
-                sheet_name, headers=["Metric", "Value", "Notes"])
+            # The header row is written below with the rest of the overview
+            worksheet = self.get_or_create_worksheet(sheet_name)
             if not worksheet:
                 return False
 
@@ -365,41 +693,33 @@ class GoogleSheetsService:
             ]
 
             # Add asset allocation if provided
+            asset_headers = ["Coin", "Balance", "USD Value", "Percentage",
+                             "Wallet", "Unrealised PnL", "Cumulative Realised PnL"]
             if asset_allocation:
                 # Empty row for spacing
                 rows_to_write.append(["", "", "", "", "", "", ""])
                 rows_to_write.append(
                     ["Asset Allocation", "", "", "", "", "", ""])
                 # Add column headers for asset allocation with new PnL columns
-                rows_to_write.append(
-                    ["Coin", "Balance", "USD Value", "Percentage", "Wallet", "Unrealised PnL", "Cumulative Realised PnL"])
-
-                # Add asset allocation data with new PnL columns
-                for asset in asset_allocation:
-                    rows_to_write.append([
-                        asset.get('Coin', ''),
-                        asset.get('Balance', ''),
-                        asset.get('USD Value', ''),
-                        asset.get('Percentage', ''),
-                        asset.get('Wallet', ''),
-                        asset.get('Unrealised PnL', ''),
-                        asset.get('Cumulative Realised PnL', '')
-                    ])
+                rows_to_write.append(asset_headers)
+
+                # Asset allocation rows are already in the column header order above
+                rows_to_write.extend(asset_allocation)
 
             worksheet.update(
                 rows_to_write, value_input_option=ValueInputOption.user_entered)
 
-            self.format_headers(worksheet)
-
-            # Apply specific formatting to cells for better presentation
-            # Format currency values
-            worksheet.format('B2:B3', {'numberFormat': {
-                             'type': 'NUMBER', 'pattern': '#,##0.00 "USDT"'}})
-            # Format win rate as a percentage
-            worksheet.format(
-                'B5', {'numberFormat': {'type': 'PERCENT', 'pattern': '0.00%'}})
-            # Bold the metric labels
-            worksheet.format('A2:A6', {'textFormat': {'bold': True}})
+            # Apply specific formatting to cells for better presentation,
+            # collected here and sent together with the header format in one request
+            format_ops = [
+                # Format currency values
+                ('B2:B3', {'numberFormat': {
+                    'type': 'NUMBER', 'pattern': '#,##0.00 "USDT"'}}),
+                # Format win rate as a percentage
+                ('B5', {'numberFormat': {'type': 'PERCENT', 'pattern': '0.00%'}}),
+                # Bold the metric labels
+                ('A2:A6', {'textFormat': {'bold': True}}),
+            ]
 
             # Format asset allocation section if present
             if asset_allocation:
@@ -409,22 +729,28 @@ class GoogleSheetsService:
                 asset_data_start = 10  # First data row
                 asset_data_end = asset_data_start + len(asset_allocation) - 1
 
-                # Bold the "Asset Allocation" title
-                worksheet.format(f'A{asset_title_row}', {
-                                 'textFormat': {'bold': True, 'fontSize': 12}})
-
-                # Bold and style the column headers (A through G now)
-                worksheet.format(f'A{asset_header_row}:G{asset_header_row}', {
-                    'textFormat': {'bold': True},
-                    'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
-                })
-
-                # Bold coin names in data rows
-                worksheet.format(f'A{asset_data_start}:A{asset_data_end}', {
-                    'textFormat': {'bold': True}
-                })
-
-            # Add pie chart if asset allocation is present
+                format_ops.extend([
+                    # Bold the "Asset Allocation" title
+                    (f'A{asset_title_row}', {
+                     'textFormat': {'bold': True, 'fontSize': 12}}),
+                    # Bold and style the column headers, as wide as the header row
+                    (f'A{asset_header_row}:{rowcol_to_a1(asset_header_row, len(asset_headers))}', {
+                        'textFormat': {'bold': True},
+                        'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
+                    }),
+                    # Bold coin names in data rows
+                    (f'A{asset_data_start}:A{asset_data_end}', {
+                        'textFormat': {'bold': True}
+                    }),
+                ])
+
+            if Config.ENABLE_FORMATTING:
+                self._enqueue(self._header_format_request(worksheet, len(headers)))
+            self._batch_format(worksheet, format_ops)
+            self._flush()
+
+            # Add pie chart if asset allocation is present. It is sent on its own, so a chart
+            # error doesn't undo the formatting above
             if asset_allocation and Config.ENABLE_FORMATTING:
                 print("   📊 Creating pie chart for asset allocation...")
                 try:
@@ -439,7 +765,7 @@ class GoogleSheetsService:
             print(f"❌ Error overwriting data in '{sheet_name}': {e}")
             return False
 
-    def add_asset_allocation_chart(self, worksheet: gspread.Worksheet, asset_allocation: List[Dict]):
+    def add_asset_allocation_chart(self, worksheet: gspread.Worksheet, asset_allocation: List[Sequence]):
         """
         Adds a pie chart for asset allocation to the worksheet.
         Chart uses USD values for sizing and shows percentage labels on slices.
@@ -447,6 +773,15 @@ class GoogleSheetsService:
         if not asset_allocation:
             return
 
+        # Execute the request
+        self._enqueue(self._asset_allocation_chart_request(
+            worksheet, asset_allocation))
+        self._flush()
+        print("   ✅ Pie chart created successfully")
+
+    @staticmethod
+    def _asset_allocation_chart_request(worksheet: gspread.Worksheet, asset_allocation: List[Sequence]) -> Dict:
+        """Builds the addChart request for the asset allocation pie chart"""
         # Calculate the data range for the chart
         # Row 8: "Asset Allocation" title
         # Row 9: Column headers (Coin, Balance, USD Value, Percentage)
@@ -456,7 +791,7 @@ class GoogleSheetsService:
         data_end_row = data_start_row + len(asset_allocation)
 
         # Create chart request using Google Sheets API
-        requests = [{
+        return {
             "addChart": {
                 "chart": {
                     "spec": {
@@ -509,12 +844,7 @@ class GoogleSheetsService:
                     }
                 }
             }
-        }]
-
-        # Execute the request
-        body = {'requests': requests}
-        self.spreadsheet.batch_update(body)
-        print("   ✅ Pie chart created successfully")
+        }
 
     def get_spreadsheet_url(self) -> Optional[str]:
         return self.spreadsheet.url if self.spreadsheet else None
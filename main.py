@@ -1,5 +1,8 @@
 # main.py
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from config import Config
 from bybit_service import BybitService
 from google_sheets_service import GoogleSheetsService
@@ -27,28 +30,47 @@ def main():
 
         # 2. Fetch Data from Bybit
         print("\n📊 Fetching data from Bybit...")
-        wallet_balance_unified = bybit.get_wallet_balance("UNIFIED")
-        wallet_balance_fund = bybit.get_funding_wallet_balance()
-        spot_trades = bybit.get_spot_trades()
-        futures_positions = bybit.get_futures_positions()
-        deposit_withdraw = bybit.get_deposit_withdraw_history()
-        internal_deposits = bybit.get_internal_deposit_records()
-        internal_transfers = bybit.get_internal_transfer_records()
-        # universal_transfers = bybit.get_universal_transfer_records()
-        # convert_history = bybit.get_convert_history()
+        # The endpoints are independent, so they are fetched concurrently
+        with ThreadPoolExecutor(max_workers=7) as executor:
+            wallet_balance_unified_future = executor.submit(
+                bybit.get_wallet_balance, "UNIFIED")
+            wallet_balance_fund_future = executor.submit(
+                bybit.get_funding_wallet_balance)
+            spot_trades_future = executor.submit(bybit.get_spot_trades)
+            futures_positions_future = executor.submit(
+                bybit.get_futures_positions)
+            deposit_withdraw_future = executor.submit(
+                bybit.get_deposit_withdraw_history)
+            internal_deposits_future = executor.submit(
+                bybit.get_internal_deposit_records)
+            internal_transfers_future = executor.submit(
+                bybit.get_internal_transfer_records)
+            # universal_transfers_future = executor.submit(
+            #     bybit.get_universal_transfer_records)
+            # convert_history_future = executor.submit(bybit.get_convert_history)
+
+        wallet_balance_unified = wallet_balance_unified_future.result()
+        wallet_balance_fund = wallet_balance_fund_future.result()
+        spot_trades = spot_trades_future.result()
+        futures_positions = futures_positions_future.result()
+        deposit_withdraw = deposit_withdraw_future.result()
+        internal_deposits = internal_deposits_future.result()
+        internal_transfers = internal_transfers_future.result()
+        # universal_transfers = universal_transfers_future.result()
+        # convert_history = convert_history_future.result()
 
         # 3. Process Data
         print("\n🔄 Processing data for final logs...")
-        futures_log_data = DataProcessor.process_futures_data(
+        futures_headers, futures_log_data = DataProcessor.process_futures_data(
             futures_positions, wallet_balance_unified)
-        spot_log_data = DataProcessor.process_spot_data(spot_trades)
-        wallet_flows_data = DataProcessor.process_wallet_flows(
+        spot_headers, spot_log_data = DataProcessor.process_spot_data(spot_trades)
+        wallet_flows_headers, wallet_flows_data = DataProcessor.process_wallet_flows(
             deposit_withdraw, internal_deposits)
-        internal_transfer_data = DataProcessor.process_internal_transfer_data(
+        internal_transfer_headers, internal_transfer_data = DataProcessor.process_internal_transfer_data(
             internal_transfers)
-        # universal_transfer_data = DataProcessor.process_universal_transfer_data(
+        # universal_transfer_headers, universal_transfer_data = DataProcessor.process_universal_transfer_data(
         #     universal_transfers)
-        # convert_history_data = DataProcessor.process_convert_history_data(
+        # convert_history_headers, convert_history_data = DataProcessor.process_convert_history_data(
         #     convert_history)
 
         # Process Portfolio Overview Data
@@ -57,46 +79,42 @@ def main():
         )
 
         # Process Asset Allocation Data
-        asset_allocation_data = DataProcessor.process_asset_allocation(
+        _, asset_allocation_data = DataProcessor.process_asset_allocation(
             wallet_balance_unified, wallet_balance_fund)
+        DataProcessor.flush_progress()
 
         # 4. Update Google Sheets
         print("\n📤 Syncing data to Google Sheets...")
 
-        # Overwrite the Portfolio Overview sheet
-        if portfolio_overview_data:
-            sheets.overwrite_portfolio_overview(
-                portfolio_overview_data, asset_allocation_data)
-
+        # The history tabs are written together in one batched overwrite,
+        # concurrently with the Portfolio Overview refresh
+        sheet_jobs = []
         if futures_log_data:
-            headers = list(futures_log_data[0].keys())
-            sheets.overwrite_data(
-                "Futures History", futures_log_data, headers=headers)
+            sheet_jobs.append(
+                ("Futures History", futures_log_data, futures_headers))
 
         if spot_log_data:
-            headers = list(spot_log_data[0].keys())
-            sheets.overwrite_data(
-                "Spot History", spot_log_data, headers=headers)
+            sheet_jobs.append(
+                ("Spot History", spot_log_data, spot_headers))
 
         if wallet_flows_data:
-            headers = list(wallet_flows_data[0].keys())
-            sheets.overwrite_data(
-                "Wallet Flows", wallet_flows_data, headers=headers)
+            sheet_jobs.append(
+                ("Wallet Flows", wallet_flows_data, wallet_flows_headers))
 
         if internal_transfer_data:
-            headers = list(internal_transfer_data[0].keys())
-            sheets.overwrite_data(
-                "Internal Transfers", internal_transfer_data, headers=headers)
+            sheet_jobs.append(
+                ("Internal Transfers", internal_transfer_data, internal_transfer_headers))
 
         # if universal_transfer_data:
-        #     headers = list(universal_transfer_data[0].keys())
-        #     sheets.overwrite_data(
-        #         "Universal Transfers", universal_transfer_data, headers=headers)
+        #     sheet_jobs.append(
+        #         ("Universal Transfers", universal_transfer_data, universal_transfer_headers))
 
         # if convert_history_data:
-        #     headers = list(convert_history_data[0].keys())
-        #     sheets.overwrite_data(
-        #         "Convert History", convert_history_data, headers=headers)
+        #     sheet_jobs.append(
+        #         ("Convert History", convert_history_data, convert_history_headers))
+
+        asyncio.run(sheets.refresh_all(
+            sheet_jobs, portfolio_overview_data, asset_allocation_data))
 
         # 5. Final Summary
         print("\n🎉 Sync completed successfully!")
@@ -9,19 +9,96 @@ to a Google Sheet. It manages four separate sheets:
 4.  Live Wallet Balance: A snapshot of current asset balances.
 """
 
+import json
+import logging
+import os
+import queue
+import random
+import signal
+import sys
+import threading
 import time
-from datetime import datetime
-from typing import Dict, List, Optional
-from pybit.unified_trading import WebSocket
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+import orjson
 
 from config import Config
 from google_sheets_service import GoogleSheetsService
 
 
+# Messages from the WebSocket callbacks and the flusher; a QueueListener thread writes them to
+# stdout, so the callback threads only pay for a queue put
+log = logging.getLogger("bybit")
+
+
+# Formatted local times by (format, epoch second); fills in a burst usually share a second
+_TS_CACHE: Dict[Tuple[str, int], str] = {}
+
+
+def _fmt_ts(epoch_ms, fmt: str = '%Y-%m-%d %H:%M:%S') -> str:
+    """
+    Formats an epoch-milliseconds value as local time (shifted by Config.TZ_OFFSET_SECONDS
+    when set), reusing earlier results for the same second.
+    """
+    key = (fmt, int(epoch_ms) // 1000)
+    formatted = _TS_CACHE.get(key)
+    if formatted is None:
+        if len(_TS_CACHE) > 4096:
+            _TS_CACHE.clear()
+        offset = Config.TZ_OFFSET_SECONDS
+        local = time.localtime(key[1]) if offset is None else time.gmtime(key[1] + offset)
+        formatted = _TS_CACHE[key] = time.strftime(fmt, local)
+    return formatted
+
+
+def _pad_decimal(value, places: int = 8) -> str:
+    """
+    Formats a decimal string from Bybit to a fixed number of decimals by padding or truncating
+    its digits, so no float round-trip (or precision loss) is involved.
+    Anything that isn't a plain decimal falls back to float formatting.
+    """
+    text = str(value).strip()
+    sign = ""
+    if text[:1] in ("-", "+"):
+        sign, text = ("-" if text[0] == "-" else ""), text[1:]
+    whole, _, frac = text.partition(".")
+    digits = whole + frac
+    if not digits or not (digits.isascii() and digits.isdigit()):
+        return f"{float(value):.{places}f}"
+    return f"{sign}{whole or '0'}.{frac[:places].ljust(places, '0')}"
+
+
+def _fmt_hms(epoch_ms) -> str:
+    """
+    Formats an epoch-milliseconds value as HH:MM:SS. With a fixed Config.TZ_OFFSET_SECONDS this
+    is plain integer arithmetic; otherwise it falls back to (DST-aware) system local time.
+    """
+    if Config.TZ_OFFSET_SECONDS is None:
+        return _fmt_ts(epoch_ms, '%H:%M:%S')
+    hh, rem = divmod((int(epoch_ms) // 1000 + Config.TZ_OFFSET_SECONDS) % 86400, 3600)
+    mm, ss = divmod(rem, 60)
+    return f"{hh:02d}:{mm:02d}:{ss:02d}"
+
+
 class WebSocketService:
     """Handles PyBit WebSocket connection and stream subscriptions."""
 
     def __init__(self, callback_handler):
+        # pybit is imported here rather than at module load, so config errors surface without
+        # paying for it, and the import overlaps the spreadsheet lookup in start()
+        from pybit import _websocket_stream
+        from pybit.unified_trading import WebSocket
+
+        # pybit (5.x) parses every incoming frame with its module-level `json` reference.
+        # Rebinding just that reference makes frame parsing use orjson, while outgoing
+        # messages keep stdlib json.dumps; the stdlib json module itself is left untouched.
+        if hasattr(_websocket_stream, "json"):
+            _websocket_stream.json = SimpleNamespace(
+                loads=orjson.loads, dumps=json.dumps)
+
         self.callback_handler = callback_handler
         self.ws = WebSocket(
             testnet=Config.BYBIT_USE_TESTNET,
@@ -63,41 +140,57 @@ class WebSocketService:
 class DataProcessor:
     """Processes and formats raw WebSocket data for Google Sheets."""
 
-    EXECUTION_HEADERS = ["Timestamp", "Category", "Symbol", "Side", "PnL", "Fee", "Exec Price",
-                         "Exec Qty", "Exec Value", "Create Type", "Order Type", "Maker/Taker", "OrderID", "ExecutionID"]
+    EXECUTION_HEADERS = ("Timestamp", "Category", "Symbol", "Side", "PnL", "Fee", "Exec Price",
+                         "Exec Qty", "Exec Value", "Create Type", "Order Type", "Maker/Taker", "OrderID", "ExecutionID")
     # # Headers for the new Live Orders sheet
     # ORDER_HEADERS = ["Updated Time", "Symbol", "Side", "Order Type", "Status", "Price", "Qty",
     #                  "Avg Fill Price", "Filled Qty", "Remaining Qty", "Take Profit", "Stop Loss", "Order ID"]
-    POSITION_HEADERS = ["Symbol", "Side", "Size", "Entry Price", "Mark Price",
-                        "Value (USD)", "Unrealized PnL", "Leverage", "Liq. Price", "Updated"]
-    WALLET_HEADERS = ["Coin", "Balance", "Available", "Value (USD)"]
-
-    @staticmethod
-    def format_execution(execution: Dict) -> Optional[Dict]:
-        """Formats an execution message for the append-only log."""
+    POSITION_HEADERS = ("Symbol", "Side", "Size", "Entry Price", "Mark Price",
+                        "Value (USD)", "Unrealized PnL", "Leverage", "Liq. Price", "Updated")
+    WALLET_HEADERS = ("Coin", "Balance", "Available", "Value (USD)")
+
+    # Field extractors in EXECUTION_HEADERS / POSITION_HEADERS order, so rows are emitted
+    # directly in sheet column order. Each one is called with the message's bound dict.get
+    _EXEC_EXTRACTORS = (
+        lambda g: _fmt_ts(g("execTime", 0)),
+        lambda g: g("category", "").capitalize(),
+        lambda g: g("symbol", ""),
+        lambda g: g("side", ""),
+        lambda g: _pad_decimal(g("execPnl", 0)),
+        lambda g: _pad_decimal(g("execFee", 0)),
+        lambda g: g("execPrice", "0"),
+        lambda g: g("execQty", "0"),
+        lambda g: g("execValue", "0"),
+        lambda g: g("createType", "N/A"),
+        lambda g: g("orderType", ""),
+        lambda g: "Maker" if g("isMaker") else "Taker",
+        lambda g: g("orderId", ""),
+        lambda g: g("execId", ""),
+    )
+    _POSITION_EXTRACTORS = (
+        lambda g: g("symbol", ""),
+        lambda g: g("side", ""),
+        lambda g: g("size", "0"),
+        lambda g: g("entryPrice", "0"),
+        lambda g: g("markPrice", "0"),
+        lambda g: g("positionValue", "0"),
+        lambda g: g("unrealisedPnl", "0"),
+        lambda g: g("leverage", ""),
+        lambda g: g("liqPrice", "0"),
+        lambda g: _fmt_hms(g("updatedTime", 0)),
+    )
+
+    @classmethod
+    def format_execution(cls, execution: Dict) -> Optional[List]:
+        """
+        Formats an execution message as an EXECUTION_HEADERS row for the append-only log.
+        Only "Trade" executions belong in the log; handle_execution filters the rest beforehand.
+        """
         try:
-            if execution.get("execType") != "Trade":
-                return None
-            pnl = float(execution.get("execPnl", 0))
-            fee = float(execution.get("execFee", 0))
-            return {
-                "Symbol": execution.get("symbol", ""),
-                "Side": execution.get("side", ""),
-                "PnL": f"{pnl:.8f}",
-                "Fee": f"{fee:.8f}",
-                "Exec Price": execution.get("execPrice", "0"),
-                "Exec Qty": execution.get("execQty", "0"),
-                "Exec Value": execution.get("execValue", "0"),
-                "Category": execution.get("category", "").capitalize(),
-                "Timestamp": datetime.fromtimestamp(int(execution.get("execTime", 0)) / 1000).strftime('%Y-%m-%d %H:%M:%S'),
-                "Create Type": execution.get("createType", "N/A"),
-                "Order Type": execution.get("orderType", ""),
-                "Maker/Taker": "Maker" if execution.get("isMaker") else "Taker",
-                "OrderID": execution.get("orderId", ""),
-                "ExecutionID": execution.get("execId", ""),
-            }
+            g = execution.get
+            return [extract(g) for extract in cls._EXEC_EXTRACTORS]
         except (ValueError, TypeError, KeyError) as e:
-            print(f"⚠️  Could not format execution: {e}")
+            log.warning(f"⚠️  Could not format execution: {e}")
             return None
 
     # # Function to process order stream data
@@ -111,7 +204,7 @@ class DataProcessor:
     #             return None
 
     #         return {
-    #             "Updated Time": datetime.fromtimestamp(int(order.get("updatedTime", 0)) / 1000).strftime('%Y-%m-%d %H:%M:%S'),
+    #             "Updated Time": _fmt_ts(order.get("updatedTime", 0)),
     #             "Symbol": order.get("symbol", ""),
     #             "Side": order.get("side", ""),
     #             "Order Type": order.get("orderType", ""),
@@ -129,55 +222,121 @@ class DataProcessor:
     #         print(f"⚠️  Could not format order: {e} | Data: {order}")
     #         return None
 
-    @staticmethod
-    def format_position(position: Dict) -> Optional[Dict]:
+    @classmethod
+    def format_position(cls, position: Dict) -> Optional[List]:
+        """Formats a position message as a POSITION_HEADERS row for the live snapshot."""
         try:
-            if float(position.get("size", "0")) == 0:
+            g = position.get
+            if float(g("size", "0")) == 0:
                 return None
-            return {"Symbol": position.get("symbol", ""), "Side": position.get("side", ""), "Size": position.get("size", "0"), "Entry Price": position.get("entryPrice", "0"), "Mark Price": position.get("markPrice", "0"), "Value (USD)": position.get("positionValue", "0"), "Unrealized PnL": position.get("unrealisedPnl", "0"), "Leverage": position.get("leverage", ""), "Liq. Price": position.get("liqPrice", "0"), "Updated": datetime.fromtimestamp(int(position.get("updatedTime", 0)) / 1000).strftime('%H:%M:%S'), }
+            return [extract(g) for extract in cls._POSITION_EXTRACTORS]
         except (ValueError, TypeError, KeyError) as e:
-            print(f"⚠️  Could not format position: {e} | Data: {position}")
+            log.warning(f"⚠️  Could not format position: {e} | Data: {position}")
             return None
 
     @staticmethod
-    def format_wallet(wallet_data: Dict) -> List[Dict]:
+    def format_wallet(wallet_data: Dict) -> List[List]:
+        """Formats a wallet message as WALLET_HEADERS rows, one per coin with a balance."""
         formatted_balances = []
         try:
             for coin in wallet_data.get('coin', []):
-                if float(coin.get("walletBalance", 0)) > 0:
-                    formatted_balances.append({"Coin": coin.get("coin", ""), "Balance": coin.get(
-                        "walletBalance", "0"), "Available": coin.get("availableToWithdraw", "0"), "Value (USD)": coin.get("usdValue", "0"), })
+                g = coin.get
+                if float(g("walletBalance", 0)) > 0:
+                    formatted_balances.append([g("coin", ""), g("walletBalance", "0"),
+                                               g("availableToWithdraw", "0"), g("usdValue", "0")])
             return formatted_balances
         except (ValueError, TypeError, KeyError) as e:
-            print(
+            log.warning(
                 f"⚠️  Could not format wallet data: {e} | Data: {wallet_data}")
             return []
 
 
+# Raw "size" strings Bybit sends for a closed position
+_ZERO_SIZES = frozenset({"0", "0.0", "0.00", "0.00000000"})
+
+
 class CallbackHandler:
     """Receives WebSocket messages, processes them, and updates Google Sheets."""
 
+    # Seconds between snapshot flushes; bursts of updates within one interval cost one write
+    FLUSH_INTERVAL = 0.25
+    # Longest wait between snapshot write retries while Sheets keeps failing
+    MAX_FLUSH_BACKOFF = 30
+    # Most recent execIds remembered for de-duplication; Bybit doesn't re-send old fills
+    MAX_LOGGED_EXEC_IDS = 100_000
+    # Upper bound on queued executions coalesced into one Real-Time Log append
+    MAX_APPEND_ROWS = 500
+    # Attempts per Real-Time Log append before its rows are spilled to a local file
+    APPEND_ATTEMPTS = 4
+    SPILL_DIR = "logs"
+    # Write-ahead log: executions are recorded here before being queued, and the .pos file
+    # holds the byte offset up to which they have been written to the Real-Time Log
+    WAL_PATH = f"{SPILL_DIR}/executions.ndjson"
+    WAL_POS_PATH = f"{WAL_PATH}.pos"
+
     def __init__(self, sheets_service: GoogleSheetsService):
         self.sheets = sheets_service
-        self.logged_exec_ids = set()
+        # Insertion-ordered, so the oldest ids are evicted first once the cap is reached
+        self.logged_exec_ids: OrderedDict = OrderedDict()
         # self.open_orders = {}  # NEW: State tracking for open orders
-        self.open_positions = {}
+        # Open positions stored column-wise in POSITION_HEADERS order, with each
+        # symbol's row index; snapshots are assembled with a single zip
+        self._pos_cols: List[List] = [[] for _ in DataProcessor.POSITION_HEADERS]
+        self._pos_symbols: List[str] = []
+        self._pos_idx: Dict[str, int] = {}
+        self._latest_wallet = []
+        # Snapshots are written by a background flusher, so the WebSocket callbacks
+        # only update state and never block on Sheets requests
+        self._state_lock = threading.Lock()
+        self._positions_dirty = threading.Event()
+        self._wallet_dirty = threading.Event()
+        # Set by shutdown(); the flusher then writes any pending snapshots one last time
+        self._stop_flusher = threading.Event()
+        self._snapshot_flusher = threading.Thread(
+            target=self._flusher, name="snapshot-flusher", daemon=True)
+        self._snapshot_flusher.start()
+        # Executions are formatted and appended on a single writer thread instead of pybit's
+        # reader thread, which keeps the Real-Time Log in arrival order; executions queued
+        # while a request is in flight go out together in the next one. Items are
+        # (executions, WAL offset after them); None stops the writer
+        self._exec_queue = queue.SimpleQueue()
+        self._wal_lock = threading.Lock()
+        self._wal = self._open_wal()
+        self._exec_writer = threading.Thread(
+            target=self._append_writer, name="sheets-writer", daemon=True)
+        self._exec_writer.start()
 
     def handle_execution(self, message: Dict):
         try:
-            for execution in message.get("data", []):
+            data = message.get("data")
+            if not data:
+                return
+            # Only de-duplication happens here; formatting is left to the writer thread
+            new_execs, new_ids = [], []
+            for execution in data:
+                if execution.get("execType") != "Trade":
+                    continue
                 exec_id = execution.get("execId")
-                if exec_id in self.logged_exec_ids:
+                if exec_id in self.logged_exec_ids or exec_id in new_ids:
                     continue
-                formatted_exec = DataProcessor.format_execution(execution)
-                if formatted_exec:
-                    self.sheets.append_data(
-                        "Real-Time Log", [formatted_exec], headers=DataProcessor.EXECUTION_HEADERS)
-                    self.logged_exec_ids.add(exec_id)
-                    print(
-                        f"✅ Logged execution: {formatted_exec['Symbol']} {formatted_exec['Side']}")
+                new_execs.append(execution)
+                new_ids.append(exec_id)
+            if new_execs:
+                with self._wal_lock:
+                    try:
+                        if self._wal is not None:
+                            self._wal_end += self._wal.write(
+                                b"".join(orjson.dumps(e) + b"\n" for e in new_execs))
+                    except OSError as e:
+                        log.error(f"⚠️  Could not record executions in the WAL: {e}")
+                    self._exec_queue.put((new_execs, self._wal_end))
+                self.logged_exec_ids.update(dict.fromkeys(new_ids))
+                while len(self.logged_exec_ids) > self.MAX_LOGGED_EXEC_IDS:
+                    self.logged_exec_ids.popitem(last=False)
+                log.info(f"✅ Logged {len(new_execs)} execution(s): " + ", ".join(
+                    f"{e.get('symbol', '')} {e.get('side', '')}" for e in new_execs))
         except Exception as e:
-            print(f"Error handling execution: {e}")
+            log.error(f"Error handling execution: {e}")
 
     # # Handler for the order stream
     # def handle_order(self, message: Dict):
@@ -209,35 +368,236 @@ class CallbackHandler:
     def handle_position(self, message: Dict):
         updated = False
         try:
-            for position in message.get("data", []):
-                symbol = position.get("symbol")
-                if not symbol:
-                    continue
-                formatted_pos = DataProcessor.format_position(position)
-                if formatted_pos:
-                    self.open_positions[symbol] = formatted_pos
-                    updated = True
-                elif symbol in self.open_positions:
-                    del self.open_positions[symbol]
-                    updated = True
+            data = message.get("data")
+            if not data:
+                return
+            # Formatted before taking the lock, so the flusher is never held up by it.
+            # Closed positions (the usual zero-size string) skip formatting altogether
+            formatted = [(position["symbol"],
+                          None if position.get("size", "0") in _ZERO_SIZES
+                          else DataProcessor.format_position(position))
+                         for position in data if position.get("symbol")]
+            with self._state_lock:
+                for symbol, formatted_pos in formatted:
+                    if formatted_pos:
+                        # Bybit re-sends unchanged positions; only real changes need a write
+                        updated |= self._set_position(symbol, formatted_pos)
+                    elif symbol in self._pos_idx:
+                        self._remove_position(symbol)
+                        updated = True
             if updated:
-                self.sheets.overwrite_data("Live Open Positions", list(
-                    self.open_positions.values()), headers=DataProcessor.POSITION_HEADERS)
-                print(f"🔄 Synced {len(self.open_positions)} open positions.")
+                self._positions_dirty.set()
         except Exception as e:
-            print(f"Error handling position update: {e}")
+            log.error(f"Error handling position update: {e}")
 
     def handle_wallet(self, message: Dict):
         try:
-            wallet_data = message.get("data", [{}])[0]
-            if not wallet_data:
+            data = message.get("data")
+            if not data or not data[0]:
                 return
+            wallet_data = data[0]
             formatted_balances = DataProcessor.format_wallet(wallet_data)
-            self.sheets.overwrite_data(
-                "Live Wallet Balance", formatted_balances, headers=DataProcessor.WALLET_HEADERS)
-            print(f"💰 Synced {len(formatted_balances)} asset balances.")
+            with self._state_lock:
+                if formatted_balances == self._latest_wallet:
+                    return
+                self._latest_wallet = formatted_balances
+            self._wallet_dirty.set()
         except Exception as e:
-            print(f"Error handling wallet update: {e}")
+            log.error(f"Error handling wallet update: {e}")
+
+    def _set_position(self, symbol: str, row: List) -> bool:
+        """Stores a position row; returns False when it equals the stored one"""
+        i = self._pos_idx.get(symbol)
+        if i is None:
+            self._pos_idx[symbol] = len(self._pos_symbols)
+            self._pos_symbols.append(symbol)
+            for col, value in zip(self._pos_cols, row):
+                col.append(value)
+            return True
+        if all(col[i] == value for col, value in zip(self._pos_cols, row)):
+            return False
+        for col, value in zip(self._pos_cols, row):
+            col[i] = value
+        return True
+
+    def _remove_position(self, symbol: str):
+        """Removes a position by moving the last row into its slot"""
+        i = self._pos_idx.pop(symbol)
+        last_symbol = self._pos_symbols.pop()
+        for col in self._pos_cols:
+            last_value = col.pop()
+            if last_symbol != symbol:
+                col[i] = last_value
+        if last_symbol != symbol:
+            self._pos_symbols[i] = last_symbol
+            self._pos_idx[last_symbol] = i
+
+    def shutdown(self):
+        """Waits for queued execution appends and a final snapshot flush to finish"""
+        self._stop_flusher.set()
+        self._snapshot_flusher.join()
+        self._exec_queue.put(None)
+        self._exec_writer.join()
+        if self._wal is not None:
+            self._wal.close()
+
+    def _open_wal(self):
+        """
+        Opens the execution WAL and queues whatever a previous run didn't get to write.
+        If the WAL can't be opened or read, the logger runs without one (None).
+        """
+        self._wal_end = 0
+        wal = None
+        try:
+            os.makedirs(os.path.dirname(self.WAL_PATH), exist_ok=True)
+            wal = open(self.WAL_PATH, 'ab+', buffering=0)
+            self._wal_end = wal.seek(0, os.SEEK_END)
+            try:
+                with open(self.WAL_POS_PATH) as f:
+                    committed = int(f.read() or 0)
+            except (OSError, ValueError):
+                committed = 0
+            if committed > self._wal_end:
+                committed = 0
+            wal.seek(committed)
+            unwritten = wal.read()
+            if unwritten and not unwritten.endswith(b"\n"):
+                # Ends a line torn by a crash, so new records start on their own line
+                self._wal_end += wal.write(b"\n")
+        except (OSError, ValueError) as e:
+            log.error(f"❌ Could not open the execution WAL at {self.WAL_PATH}, running without it: {e}")
+            if wal is not None:
+                wal.close()
+            self._wal_end = 0
+            return None
+        pending = []
+        for line in unwritten.splitlines():
+            try:
+                pending.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                continue
+        if pending:
+            self.logged_exec_ids.update(dict.fromkeys(e.get("execId") for e in pending))
+            self._exec_queue.put((pending, self._wal_end))
+            log.info(f"♻️  Replaying {len(pending)} execution(s) missing from the Real-Time Log")
+        return wal
+
+    def _commit_wal(self, offset: int):
+        """Records that executions up to offset are written; a fully written WAL is emptied"""
+        if self._wal is None:
+            return
+        with self._wal_lock:
+            if offset == self._wal_end:
+                offset = self._wal_end = 0
+            try:
+                # The offset is saved before truncating, so a crash in between replays
+                # (duplicates) instead of skipping executions
+                with open(self.WAL_POS_PATH, 'w') as f:
+                    f.write(str(offset))
+                if not offset:
+                    self._wal.truncate(0)
+            except OSError as e:
+                log.error(f"⚠️  Could not update the WAL position: {e}")
+
+    def _append_writer(self):
+        """Formats queued executions and appends them to the Real-Time Log, draining whatever has piled up"""
+        stopping = False
+        while not stopping:
+            batch = self._exec_queue.get()
+            if batch is None:
+                return
+            executions, wal_offset = list(batch[0]), batch[1]
+            while len(executions) < self.MAX_APPEND_ROWS:
+                try:
+                    batch = self._exec_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if batch is None:
+                    stopping = True
+                    break
+                executions.extend(batch[0])
+                wal_offset = batch[1]
+            rows = [row for row in map(DataProcessor.format_execution, executions) if row]
+            if rows:
+                self._write_executions(rows)
+            self._commit_wal(wal_offset)
+
+    def _write_executions(self, rows: List[List]):
+        """
+        Appends rows to the Real-Time Log, retrying failed writes with jittered exponential
+        backoff (429s are already retried by the Sheets client). Rows that still can't be
+        written are spilled to a local JSONL file instead of being dropped.
+        """
+        for attempt in range(self.APPEND_ATTEMPTS):
+            try:
+                if self.sheets.append_data(
+                        "Real-Time Log", rows, headers=DataProcessor.EXECUTION_HEADERS):
+                    return
+            except Exception as e:
+                log.error(f"Error appending executions: {e}")
+            if attempt < self.APPEND_ATTEMPTS - 1:
+                wait = min(0.5 * 2 ** attempt, 8) * random.uniform(0.5, 1.5)
+                log.warning(f"⏳ Real-Time Log append failed, retrying in {wait:.1f}s...")
+                time.sleep(wait)
+        self._spill(rows)
+
+    def _spill(self, rows: List[List]):
+        """Appends unwritten execution rows to today's spill file, one JSON array per line"""
+        path = f"{self.SPILL_DIR}/realtime_spill-{time.strftime('%Y%m%d')}.jsonl"
+        try:
+            os.makedirs(self.SPILL_DIR, exist_ok=True)
+            with open(path, 'ab') as f:
+                f.writelines(orjson.dumps(row) + b"\n" for row in rows)
+            log.error(f"❌ Could not write {len(rows)} execution(s) to the Real-Time Log; saved to {path}")
+        except OSError as e:
+            log.error(f"❌ Lost {len(rows)} execution(s), could not write {path}: {e}")
+
+    def _flusher(self):
+        """
+        Writes the latest position and wallet snapshots, at most once per FLUSH_INTERVAL.
+        A snapshot whose write fails is marked dirty again and retried with exponential backoff.
+        Once shutdown() sets _stop_flusher, dirty snapshots are written one final time.
+        """
+        failures = 0
+        while not self._stop_flusher.wait(
+                min(self.FLUSH_INTERVAL * 2 ** failures, self.MAX_FLUSH_BACKOFF)):
+            failures = 0 if self._flush_snapshots() else min(failures + 1, 8)
+        self._flush_snapshots()
+
+    def _flush_snapshots(self) -> bool:
+        """Writes the dirty position and wallet snapshots; returns False if any write failed"""
+        synced = True
+        if self._positions_dirty.is_set():
+            self._positions_dirty.clear()
+            with self._state_lock:
+                positions = list(zip(*self._pos_cols))
+            try:
+                ok = self.sheets.overwrite_data(
+                    "Live Open Positions", positions, headers=DataProcessor.POSITION_HEADERS)
+            except Exception as e:
+                ok = False
+                log.error(f"Error syncing positions: {e}")
+            if ok:
+                log.info(f"🔄 Synced {len(positions)} open positions.")
+            else:
+                self._positions_dirty.set()
+                synced = False
+        if self._wallet_dirty.is_set():
+            self._wallet_dirty.clear()
+            with self._state_lock:
+                balances = self._latest_wallet
+            try:
+                ok = self.sheets.overwrite_data(
+                    "Live Wallet Balance", balances, headers=DataProcessor.WALLET_HEADERS)
+            except Exception as e:
+                ok = False
+                log.error(f"Error syncing wallet: {e}")
+            if ok:
+                log.info(f"💰 Synced {len(balances)} asset balances.")
+            else:
+                self._wallet_dirty.set()
+                synced = False
+        return synced
 
 
 class PyBitRealTimeLogger:
@@ -245,15 +605,32 @@ class PyBitRealTimeLogger:
 
     def __init__(self):
         print("🚀 Initializing PyBit Real-Time Logger...")
+        log_queue = queue.SimpleQueue()
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._log_listener = QueueListener(log_queue, handler)
+        self._log_listener.start()
+        log.addHandler(QueueHandler(log_queue))
+        log.setLevel(logging.INFO)
+        log.propagate = False
         self.sheets_service = GoogleSheetsService()
         self.callback_handler = CallbackHandler(self.sheets_service)
-        self.websocket_service = WebSocketService(self.callback_handler)
+        # Connected in start(), alongside the spreadsheet lookup
+        self.websocket_service: Optional[WebSocketService] = None
+        # Set on SIGTERM; the main thread sleeps on it until then (or until Ctrl-C)
+        self._stop_evt = threading.Event()
 
     def start(self):
         print("=" * 50)
         try:
             Config.validate()
-            if not self.sheets_service.test_connection():
+            # The WebSocket handshake and the spreadsheet lookup are independent network
+            # round-trips, so they run side by side
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                ws_future = pool.submit(WebSocketService, self.callback_handler)
+                sheets_ok = self.sheets_service.test_connection()
+                self.websocket_service = ws_future.result()
+            if not sheets_ok:
                 return
             if self.websocket_service.start_streams():
                 print("\n🎉 Real-time logging is now ACTIVE!")
@@ -264,12 +641,17 @@ class PyBitRealTimeLogger:
                 print(
                     f"\n🔗 View your sheet at: {self.sheets_service.get_spreadsheet_url()}")
                 print("\nPress Ctrl-C to stop the logger.")
-                while True:
-                    time.sleep(1)
+                signal.signal(signal.SIGTERM,
+                              lambda *_: self._stop_evt.set())
+                self._stop_evt.wait()
+                print("\n⏹️ Termination requested. Stopping logger...")
         except KeyboardInterrupt:
             print("\n⏹️ User requested shutdown. Stopping logger...")
         finally:
-            self.websocket_service.stop_streams()
+            if self.websocket_service:
+                self.websocket_service.stop_streams()
+            self.callback_handler.shutdown()
+            self._log_listener.stop()
             print("Logger has been stopped.")
 
 